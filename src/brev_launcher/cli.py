@@ -1,13 +1,9 @@
 """Brev Launcher CLI - Generate Brev Launchable configs."""
 
-import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
 import typer
-from rich.console import Console
-from rich.prompt import Confirm, IntPrompt, Prompt
-from rich.table import Table
 
 from . import __version__
 from .constants import (
@@ -21,27 +17,12 @@ from .constants import (
     PROJECT_TYPE_NOTEBOOK,
     PROJECT_TYPE_WEBAPP,
 )
-from .detect import detect_dependency_file, detect_entry_file, estimate_vram_usage, estimate_vram_usage_detailed, find_candidate_entry_files
-from .gitinfo import GitError
-from .launchable_schema import LaunchableConfig, SourceConfig
-from .output import (
-    console,
-    print_badge_snippet,
-    print_doctor_results,
-    print_error,
-    print_file_written,
-    print_info,
-    print_next_steps,
-    print_smoke_test_checklist,
-    print_success,
-    print_validation_error,
-    print_warning,
-    print_yaml_preview,
-)
-from .pricing import GPU_PRICING, calculate_monthly_cost, calculate_yearly_cost, recommend_gpu
-from .pricing_advanced import recommend_gpu_advanced, format_instance_name, BrevInstance
-from .project_scan import scan_project
-from .render_yaml import render_yaml, write_launchable_yaml
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Heavy subsystems (rich, pydantic, ruamel.yaml, detection/pricing modules) are
+# imported inside the commands that use them so --version and --help stay fast.
 
 app = typer.Typer(
     name="brev-launcher",
@@ -53,7 +34,8 @@ app = typer.Typer(
 def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
-        console.print(f"brev-launcher {__version__}")
+        # Plain echo so --version never loads rich or any subsystem
+        typer.echo(f"brev-launcher {__version__}")
         raise typer.Exit()
 
 
@@ -75,7 +57,7 @@ def main(
 @app.command()
 def init(
     path: Path = typer.Argument(
-        Path.cwd(),
+        Path("."),
         help="Project directory path (defaults to current directory).",
         exists=True,
         file_okay=False,
@@ -110,6 +92,26 @@ def init(
     4. Generates launchable.yaml
     5. Prints next steps and badge snippet
     """
+    from rich.prompt import Confirm, IntPrompt, Prompt
+
+    from .gitinfo import GitError
+    from .launchable_schema import LaunchableConfig, SourceConfig
+    from .output import (
+        console,
+        print_badge_snippet,
+        print_error,
+        print_file_written,
+        print_info,
+        print_next_steps,
+        print_smoke_test_checklist,
+        print_success,
+        print_validation_error,
+        print_warning,
+        print_yaml_preview,
+    )
+    from .project_scan import scan_project
+    from .render_yaml import render_yaml, write_launchable_yaml
+
     console.print()
     console.print("[bold]🚀 Brev Launcher - Initialize Launchable Config[/bold]")
     console.print()
@@ -168,33 +170,35 @@ def init(
             brev=check_brev_cli(),
         )
     
-    if has_git:
-        print_success(f"Git repository: {scan.git.normalized_url}")
-        print_success(f"Default branch: {scan.git.default_branch}")
-    else:
-        print_warning("Git repository: Not configured (will need manual setup)")
+    # Buffer the scan summary so it reaches the terminal in one write
+    with console:
+        if has_git:
+            print_success(f"Git repository: {scan.git.normalized_url}")
+            print_success(f"Default branch: {scan.git.default_branch}")
+        else:
+            print_warning("Git repository: Not configured (will need manual setup)")
 
-    if scan.dependency_file:
-        print_success(f"Dependency file: {scan.dependency_file}")
-    else:
-        print_warning("No requirements.txt or pyproject.toml found")
+        if scan.dependency_file:
+            print_success(f"Dependency file: {scan.dependency_file}")
+        else:
+            print_warning("No requirements.txt or pyproject.toml found")
 
-    if scan.entry_file:
-        print_success(f"Entry file detected: {scan.entry_file}")
+        if scan.entry_file:
+            print_success(f"Entry file detected: {scan.entry_file}")
 
-    # Show Brev/GPU detection info
-    if scan.brev.available:
-        print_info(f"Brev CLI available (instance: {scan.brev.instance_name or 'unknown'})")
-    
-    if scan.brev.gpu_type and scan.brev.gpu_type != "any":
-        gpu_info = f"GPU detected: {scan.brev.gpu_type}"
-        if scan.brev.gpu_memory_gb:
-            gpu_info += f" ({scan.brev.gpu_memory_gb}GB VRAM)"
-        print_success(gpu_info)
+        # Show Brev/GPU detection info
+        if scan.brev.available:
+            print_info(f"Brev CLI available (instance: {scan.brev.instance_name or 'unknown'})")
 
-    # Step 1: Minimal questions
-    console.print()
+        if scan.brev.gpu_type and scan.brev.gpu_type != "any":
+            gpu_info = f"GPU detected: {scan.brev.gpu_type}"
+            if scan.brev.gpu_memory_gb:
+                gpu_info += f" ({scan.brev.gpu_memory_gb}GB VRAM)"
+            print_success(gpu_info)
 
+        console.print()
+
+    # Step 1: Minimal questions
     # Determine project type
     if project_type:
         chosen_type = project_type
@@ -272,21 +276,24 @@ def init(
         else:
             config.with_webapp(command=chosen_command, port=chosen_port)
 
-        # Step 3: Write launchable.yaml
-        output_path = write_launchable_yaml(config, path)
-        print_file_written(output_path)
-
-        # Show preview
+        # Step 3: Write launchable.yaml (rendered once for file and preview)
         yaml_content = render_yaml(config)
-        print_yaml_preview(yaml_content)
+        output_path = write_launchable_yaml(config, path, yaml_content)
 
-        # Step 4: Print next steps and badge
-        print_next_steps(output_path)
-        print_badge_snippet()
-        print_smoke_test_checklist()
+        # Buffer the closing output so it reaches the terminal in one write
+        with console:
+            print_file_written(output_path)
 
-        console.print()
-        print_success("Done! Your Launchable config is ready.")
+            # Show preview
+            print_yaml_preview(yaml_content)
+
+            # Step 4: Print next steps and badge
+            print_next_steps(output_path)
+            print_badge_snippet()
+            print_smoke_test_checklist()
+
+            console.print()
+            print_success("Done! Your Launchable config is ready.")
 
     except typer.Exit:
         raise
@@ -295,79 +302,86 @@ def init(
         raise typer.Exit(EXIT_GENERATION_FAILURE)
 
 
-@app.command()
-def doctor(
-    path: Path = typer.Argument(
-        Path.cwd(),
-        help="Project directory path.",
-        exists=True,
-        file_okay=False,
-        dir_okay=True,
-        resolve_path=True,
-    ),
-) -> None:
-    """Check project health and Brev compatibility.
-
-    Runs a series of checks to verify the project is ready for Brev deployment.
-    """
-    console.print()
-    console.print("[bold]🩺 Brev Launcher - Project Doctor[/bold]")
-    console.print()
-
-    checks: list[tuple[str, bool, str]] = []
-
-    # Check git repo
-    from .gitinfo import is_git_repo, get_origin_url
+def _doctor_checks(path: Path) -> Iterator[tuple[str, bool, str]]:
+    """Run doctor checks lazily, yielding (check_name, passed, message) as each finishes."""
+    from .detect import (
+        detect_dependency_file,
+        detect_entry_file,
+        detect_env_example,
+        detect_launchable_yaml,
+        find_candidate_entry_files,
+    )
+    from .gitinfo import probe_git
 
-    if is_git_repo(path):
-        checks.append(("Git repository", True, "Project is a git repo"))
+    # Check git repo and origin (one git call for both)
+    in_repo, origin = probe_git(path)
+    if in_repo:
+        yield ("Git repository", True, "Project is a git repo")
     else:
-        checks.append(("Git repository", False, "Not a git repository"))
+        yield ("Git repository", False, "Not a git repository")
 
     # Check origin
-    origin = get_origin_url(path)
     if origin:
-        checks.append(("Origin remote", True, origin))
+        yield ("Origin remote", True, origin)
     else:
-        checks.append(("Origin remote", False, "No origin remote configured"))
+        yield ("Origin remote", False, "No origin remote configured")
 
     # Check dependency file
     dep_file = detect_dependency_file(path)
     if dep_file:
-        checks.append(("Dependencies", True, f"Found {dep_file}"))
+        yield ("Dependencies", True, f"Found {dep_file}")
     else:
-        checks.append(("Dependencies", False, "No requirements.txt or pyproject.toml"))
+        yield ("Dependencies", False, "No requirements.txt or pyproject.toml")
 
     # Check entry file
     entry = detect_entry_file(path)
     if entry:
-        checks.append(("Entry file", True, f"Found {entry}"))
+        yield ("Entry file", True, f"Found {entry}")
     else:
-        candidates = find_candidate_entry_files(path)
+        candidates = find_candidate_entry_files(path, limit=3)
         if candidates:
-            checks.append(("Entry file", True, f"Candidates: {', '.join(candidates[:3])}"))
+            yield ("Entry file", True, f"Candidates: {', '.join(candidates)}")
         else:
-            checks.append(("Entry file", False, "No entry file found"))
+            yield ("Entry file", False, "No entry file found")
 
     # Check launchable.yaml
-    launchable = path / "launchable.yaml"
-    if launchable.exists():
-        checks.append(("Launchable config", True, "launchable.yaml exists"))
+    if detect_launchable_yaml(path):
+        yield ("Launchable config", True, "launchable.yaml exists")
     else:
-        checks.append(("Launchable config", False, "Run 'brev-launcher init' to create"))
+        yield ("Launchable config", False, "Run 'brev-launcher init' to create")
 
     # Check .env.example
-    from .detect import detect_env_example
-
     if detect_env_example(path):
-        checks.append(("Environment", True, ".env.example found"))
+        yield ("Environment", True, ".env.example found")
     else:
-        checks.append(("Environment", True, "No .env.example (optional)"))
+        yield ("Environment", True, "No .env.example (optional)")
+
+
+@app.command()
+def doctor(
+    path: Path = typer.Argument(
+        Path("."),
+        help="Project directory path.",
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        resolve_path=True,
+    ),
+) -> None:
+    """Check project health and Brev compatibility.
 
-    print_doctor_results(checks)
+    Runs a series of checks to verify the project is ready for Brev deployment.
+    """
+    from .output import console, print_doctor_results
+
+    console.print()
+    console.print("[bold]🩺 Brev Launcher - Project Doctor[/bold]")
+    console.print()
+
+    # Each check is printed as soon as it completes
+    all_passed = print_doctor_results(_doctor_checks(path))
 
     # Exit with appropriate code
-    all_passed = all(passed for _, passed, _ in checks)
     raise typer.Exit(EXIT_SUCCESS if all_passed else EXIT_VALIDATION_FAILURE)
 
 
@@ -383,6 +397,8 @@ def print_badge(
     Use after creating a Launchable in the Brev console.
     Get the Launchable ID from the deployment URL.
     """
+    from .output import console, print_badge_snippet
+
     console.print()
     console.print("[bold]🏷️  Brev Launcher - Badge Generator[/bold]")
     print_badge_snippet(launchable_id)
@@ -392,7 +408,7 @@ def print_badge(
 @app.command("cost-estimate")
 def cost_estimate(
     path: Path = typer.Argument(
-        Path.cwd(),
+        Path("."),
         help="Project directory path (defaults to current directory).",
         exists=True,
         file_okay=False,
@@ -419,6 +435,19 @@ def cost_estimate(
     
     Use --advanced to see detailed provider comparison across 490+ instances.
     """
+    from rich.table import Table
+    from rich.text import Text
+
+    from .detect import detect_current_gpu, estimate_vram_usage_detailed
+    from .output import console, print_info
+    from .pricing import (
+        GPU_PRICING,
+        GPU_PRICING_SORTED,
+        calculate_monthly_cost,
+        calculate_yearly_cost,
+        recommend_gpu,
+    )
+
     console.print()
     console.print("[bold]💰 GPU Cost Analyzer[/bold]")
     console.print()
@@ -426,14 +455,10 @@ def cost_estimate(
     # Try to scan project for info
     print_info("Analyzing project...")
     
-    try:
-        scan = scan_project(path)
-        current_gpu = scan.brev.gpu_type if scan.brev.gpu_type else "gpu_1x_a10"
-        has_git = True
-    except GitError:
-        # No git repo, use defaults
-        current_gpu = "gpu_1x_a10"
-        has_git = False
+    # Only the current GPU is needed here; a full scan_project would also run
+    # git, `brev ls` and the port scan for results this command never shows
+    # Without a GPU this is "any", shown as Brev's flexible "Any GPU" option
+    current_gpu = detect_current_gpu()
     
     current_info = GPU_PRICING.get(current_gpu, GPU_PRICING["gpu_1x_a10"])
     
@@ -494,14 +519,12 @@ def cost_estimate(
     table.add_column("vs Current", justify="right", width=15)
     table.add_column("Status", width=10)
     
-    for gpu_id, info in sorted(GPU_PRICING.items(), key=lambda x: x[1]["cost_per_hour"]):
-        if gpu_id == "any":
-            continue
-        
+    current_monthly = calculate_monthly_cost(current_info["cost_per_hour"], hours_per_day)
+
+    for gpu_id, info in GPU_PRICING_SORTED:
         monthly = calculate_monthly_cost(info["cost_per_hour"], hours_per_day)
         yearly = calculate_yearly_cost(info["cost_per_hour"], hours_per_day)
         
-        current_monthly = calculate_monthly_cost(current_info["cost_per_hour"], hours_per_day)
         savings_monthly = current_monthly - monthly
         
         # Determine if GPU fits requirements
@@ -521,22 +544,23 @@ def cost_estimate(
         
         # Savings column
         if gpu_id == current_gpu:
-            savings_str = "—"
+            savings_text = Text("—")
         elif savings_monthly > 0:
-            savings_str = f"[green]+${savings_monthly:.0f}/mo[/green]"
+            savings_text = Text(f"+${savings_monthly:.0f}/mo", style="green")
         elif savings_monthly < 0:
-            savings_str = f"[red]-${abs(savings_monthly):.0f}/mo[/red]"
+            savings_text = Text(f"-${abs(savings_monthly):.0f}/mo", style="red")
         else:
-            savings_str = "±$0/mo"
+            savings_text = Text("±$0/mo")
         
+        # Styled Text cells skip Rich's markup parser at render time
         table.add_row(
-            info["name"],
-            f"{info['vram_gb']}GB",
-            f"${info['cost_per_hour']:.2f}",
-            f"${monthly:.0f}",
-            f"${yearly:.0f}",
-            savings_str,
-            status,
+            Text(info["name"]),
+            Text(f"{info['vram_gb']}GB"),
+            Text(f"${info['cost_per_hour']:.2f}"),
+            Text(f"${monthly:.0f}"),
+            Text(f"${yearly:.0f}"),
+            savings_text,
+            Text(status),
         )
     
     console.print(table)
@@ -571,11 +595,15 @@ def _show_advanced_recommendations(
     estimated_vram: float,
     current_info: dict,
     hours_per_day: int,
-    console: Console,
+    console: "Console",
     vram_details: Optional[dict] = None,
 ) -> None:
     """Show advanced recommendations with 490+ instance options."""
-    from .pricing_advanced import BREV_INSTANCES
+    from rich.table import Table
+    from rich.text import Text
+
+    from .pricing import calculate_monthly_cost, calculate_yearly_cost
+    from .pricing_advanced import format_instance_name, recommend_gpu_advanced
     
     console.print("[bold magenta]🚀 Advanced Mode: Analyzing 490+ Brev instances...[/bold magenta]")
     console.print()
@@ -599,17 +627,17 @@ def _show_advanced_recommendations(
     if vram_details and vram_details["detected_models"]:
         primary_model = max(vram_details["detected_models"], key=lambda x: x["vram"])
         console.print(f"  Based on: [cyan]{primary_model['model']}[/cyan] ({primary_model['vram']}GB base × 1.5 buffer)")
-    console.print(f"  Cheapest fit: [bold]{format_instance_name(rec)}[/bold] with {rec['total_vram_gib']:.0f}GB total")
+    console.print(f"  Cheapest fit: [bold]{format_instance_name(rec)}[/bold] with {rec.total_vram_gib:.0f}GB total")
     console.print()
     
     # Show top recommendation
     console.print("[bold green]🏆 Best Option:[/bold green]")
     console.print(f"  Config: [bold]{format_instance_name(rec)}[/bold]")
-    console.print(f"  VRAM: {rec['total_vram_gib']:.0f}GB total ({rec['gpus']}x {rec['vram_per_gpu_gib']:.0f}GB)")
-    console.print(f"  Cost: [green]${rec['price_per_hour']:.2f}/hour[/green]")
+    console.print(f"  VRAM: {rec.total_vram_gib:.0f}GB total ({rec.gpus}x {rec.vram_per_gpu_gib:.0f}GB)")
+    console.print(f"  Cost: [green]${rec.price_per_hour:.2f}/hour[/green]")
     
-    monthly = calculate_monthly_cost(rec["price_per_hour"], hours_per_day)
-    yearly = calculate_yearly_cost(rec["price_per_hour"], hours_per_day)
+    monthly = calculate_monthly_cost(rec.price_per_hour, hours_per_day)
+    yearly = calculate_yearly_cost(rec.price_per_hour, hours_per_day)
     console.print(f"  Monthly: [green]${monthly:.0f}[/green] ({hours_per_day}h/day)")
     console.print(f"  Yearly: [green]${yearly:.0f}[/green]")
     
@@ -631,24 +659,24 @@ def _show_advanced_recommendations(
         table.add_column("vs Best", justify="right", width=12)
         
         for alt in recommendation["alternatives"]:
-            alt_monthly = calculate_monthly_cost(alt["price_per_hour"], hours_per_day)
-            alt_yearly = calculate_yearly_cost(alt["price_per_hour"], hours_per_day)
+            alt_monthly = calculate_monthly_cost(alt.price_per_hour, hours_per_day)
+            alt_yearly = calculate_yearly_cost(alt.price_per_hour, hours_per_day)
             
-            price_diff = alt["price_per_hour"] - rec["price_per_hour"]
+            price_diff = alt.price_per_hour - rec.price_per_hour
             monthly_diff = calculate_monthly_cost(price_diff, hours_per_day)
             
             if price_diff > 0:
-                diff_str = f"[yellow]+${monthly_diff:.0f}/mo[/yellow]"
+                diff_text = Text(f"+${monthly_diff:.0f}/mo", style="yellow")
             else:
-                diff_str = f"[green]${monthly_diff:.0f}/mo[/green]"
+                diff_text = Text(f"${monthly_diff:.0f}/mo", style="green")
             
             table.add_row(
-                format_instance_name(alt),
-                f"{alt['total_vram_gib']:.0f}GB",
-                f"${alt['price_per_hour']:.2f}",
-                f"${alt_monthly:.0f}",
-                f"${alt_yearly:.0f}",
-                diff_str,
+                Text(format_instance_name(alt)),
+                Text(f"{alt.total_vram_gib:.0f}GB"),
+                Text(f"${alt.price_per_hour:.2f}"),
+                Text(f"${alt_monthly:.0f}"),
+                Text(f"${alt_yearly:.0f}"),
+                diff_text,
             )
         
         console.print(table)
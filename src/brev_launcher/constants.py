@@ -23,9 +23,11 @@ REQUIREMENTS_TXT = "requirements.txt"
 PYPROJECT_TOML = "pyproject.toml"
 ENV_EXAMPLE = ".env.example"
 
-# Entry file priorities
-NOTEBOOK_ENTRY_FILES = ["main.ipynb", "notebook.ipynb", "demo.ipynb"]
-WEBAPP_ENTRY_FILES = ["app.py", "main.py", "server.py", "api.py"]
+# Entry file priorities (ordered) and their set views for membership checks
+NOTEBOOK_ENTRY_FILES = ("main.ipynb", "notebook.ipynb", "demo.ipynb")
+WEBAPP_ENTRY_FILES = ("app.py", "main.py", "server.py", "api.py")
+NOTEBOOK_ENTRY_SET = frozenset(NOTEBOOK_ENTRY_FILES)
+WEBAPP_ENTRY_SET = frozenset(WEBAPP_ENTRY_FILES)
 
 # Common ports to detect in code
 COMMON_APP_PORTS = [7860, 8000, 8080, 5000, 3000, 8501, 8502]
@@ -1,29 +1,85 @@
 """Detection logic for project type and entry files."""
 
+import functools
+import heapq
+import os
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, NamedTuple, Optional
 
 from .constants import (
     COMMON_APP_PORTS,
+    LAUNCHABLE_YAML,
     NOTEBOOK_ENTRY_FILES,
     WEBAPP_ENTRY_FILES,
+    WEBAPP_ENTRY_SET,
 )
 
 
+class _DirIndex(NamedTuple):
+    """Top-level entries of a project directory, classified in one pass."""
+
+    names: frozenset[str]
+    dirs: frozenset[str]
+    py_files: tuple[str, ...]
+    ipynb_files: tuple[str, ...]
+
+
+_EMPTY_INDEX = _DirIndex(frozenset(), frozenset(), (), ())
+
+
+@functools.lru_cache(maxsize=32)
+def _build_dir_index(path: str, mtime_ns: int) -> _DirIndex:
+    """List ``path`` once with os.scandir. ``mtime_ns`` is only a cache key."""
+    names = []
+    dirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                names.append(entry.name)
+                # d_type from the directory listing; no extra stat on most filesystems
+                if entry.is_dir():
+                    dirs.append(entry.name)
+    except OSError:
+        return _EMPTY_INDEX
+
+    names.sort()
+    return _DirIndex(
+        names=frozenset(names),
+        dirs=frozenset(dirs),
+        py_files=tuple(n for n in names if n.endswith(".py")),
+        ipynb_files=tuple(n for n in names if n.endswith(".ipynb")),
+    )
+
+
+def _scan_dir(path: Path) -> _DirIndex:
+    """Get the cached index for ``path``.
+
+    Keyed on the directory mtime, so adding, removing or renaming entries
+    invalidates it (editing a file's contents does not, which is fine since
+    only entry names are indexed).
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return _EMPTY_INDEX
+    return _build_dir_index(os.fspath(path), mtime_ns)
+
+
 def detect_dependency_file(path: Path = Path.cwd()) -> Optional[str]:
     """Detect the dependency file in the project.
 
     Returns:
         Path to requirements.txt or pyproject.toml if found, None otherwise.
     """
-    requirements = path / "requirements.txt"
-    if requirements.exists():
+    names = _scan_dir(path).names
+    if "requirements.txt" in names:
         return "requirements.txt"
 
-    pyproject = path / "pyproject.toml"
-    if pyproject.exists():
+    if "pyproject.toml" in names:
         return "pyproject.toml"
 
     return None
@@ -39,90 +95,121 @@ def detect_entry_file(path: Path = Path.cwd(), project_type: str = "notebook") -
     Returns:
         Entry file name if found, None otherwise.
     """
+    index = _scan_dir(path)
+
     if project_type == "notebook":
         # Check prioritized notebook files
         for notebook in NOTEBOOK_ENTRY_FILES:
-            if (path / notebook).exists():
+            if notebook in index.names:
                 return notebook
 
         # Look for any .ipynb file
-        notebooks = list(path.glob("*.ipynb"))
-        if notebooks:
-            return notebooks[0].name
+        if index.ipynb_files:
+            return index.ipynb_files[0]
 
     else:  # webapp
         # Check prioritized webapp files
         for entry in WEBAPP_ENTRY_FILES:
-            if (path / entry).exists():
+            if entry in index.names:
                 return entry
 
         # Look for any .py file as fallback
-        py_files = list(path.glob("*.py"))
-        if py_files:
-            return py_files[0].name
+        if index.py_files:
+            return index.py_files[0]
 
     return None
 
 
-def find_candidate_entry_files(path: Path = Path.cwd()) -> list[str]:
+def find_candidate_entry_files(
+    path: Path = Path.cwd(), limit: Optional[int] = None
+) -> list[str]:
     """Find all candidate entry files in the project.
 
+    Args:
+        path: Project directory path.
+        limit: Return only the first N candidates in sorted order.
+
     Returns:
         List of potential entry file names.
     """
-    candidates = []
-
-    # Add notebooks
-    for notebook in path.glob("*.ipynb"):
-        candidates.append(notebook.name)
+    index = _scan_dir(path)
 
-    # Add Python files
-    for py_file in path.glob("*.py"):
-        # Skip test files and __init__.py
-        if not py_file.name.startswith("test_") and py_file.name != "__init__.py":
-            candidates.append(py_file.name)
+    # Skip test files and __init__.py
+    py_files = (
+        name
+        for name in index.py_files
+        if not name.startswith("test_") and name != "__init__.py"
+    )
 
-    return sorted(candidates)
+    # Both lists are already sorted, so merging lazily lets a limit stop early
+    candidates = heapq.merge(index.ipynb_files, py_files)
+    return list(islice(candidates, limit))
 
 
 def detect_env_example(path: Path = Path.cwd()) -> bool:
     """Check if .env.example exists."""
-    return (path / ".env.example").exists()
+    return ".env.example" in _scan_dir(path).names
+
+
+def detect_launchable_yaml(path: Path = Path.cwd()) -> bool:
+    """Check if launchable.yaml exists."""
+    return LAUNCHABLE_YAML in _scan_dir(path).names
 
 
 def detect_notebooks_folder(path: Path = Path.cwd()) -> bool:
     """Check if a notebooks folder exists."""
-    notebooks_dir = path / "notebooks"
-    return notebooks_dir.exists() and notebooks_dir.is_dir()
+    return "notebooks" in _scan_dir(path).dirs
+
+
+# Port assignments or arguments: port=, PORT=, --port, or host:port.
+# Matched backwards from each literal port number found in a file.
+_PORT_PREFIX_RE = re.compile(rb"(?:port\s*=\s*|PORT\s*=\s*|--port[=\s]+|:)\Z")
+# How far before a port number its prefix may start
+_PORT_PREFIX_WINDOW = 64
+_PORT_LITERALS = tuple((port, str(port).encode()) for port in COMMON_APP_PORTS)
+# Ports are set near the top of a script; don't read large generated files whole
+_PORT_SCAN_BYTES = 256 * 1024
+
+
+def _has_port(data: bytes, literal: bytes) -> bool:
+    """Check whether data sets a port to exactly this literal number."""
+    start = data.find(literal)
+    while start != -1:
+        end = start + len(literal)
+        # Reject matches inside longer numbers, e.g. 5000 in 15000 or 50001
+        if not data[start - 1:start].isdigit() and not data[end:end + 1].isdigit():
+            if _PORT_PREFIX_RE.search(data, max(0, start - _PORT_PREFIX_WINDOW), start):
+                return True
+        start = data.find(literal, end)
+    return False
 
 
 def detect_ports_in_code(path: Path = Path.cwd()) -> list[int]:
     """Detect common ports mentioned in Python files.
 
-    This is a heuristic that looks for port patterns in code.
+    This is a heuristic that looks for port patterns in code. Only the
+    first 256 KiB of each file is scanned.
     """
-    detected_ports = set()
-
-    # Pattern to match port assignments or arguments
-    port_patterns = [
-        r"port\s*=\s*(\d+)",
-        r"PORT\s*=\s*(\d+)",
-        r"--port[=\s]+(\d+)",
-        r":(\d+)",
-    ]
+    detected_ports: set[int] = set()
+    root = os.fspath(path)
 
-    for py_file in path.glob("*.py"):
+    for name in _scan_dir(path).py_files:
         try:
-            content = py_file.read_text()
-            for pattern in port_patterns:
-                matches = re.findall(pattern, content)
-                for match in matches:
-                    port = int(match)
-                    if port in COMMON_APP_PORTS:
-                        detected_ports.add(port)
-        except (OSError, ValueError):
+            with open(os.path.join(root, name), "rb") as f:
+                data = f.read(_PORT_SCAN_BYTES)
+        except OSError:
             continue
 
+        # Search for the handful of known port numbers directly instead of
+        # running a regex over every ':<digits>' in the file
+        for port, literal in _PORT_LITERALS:
+            if port not in detected_ports and _has_port(data, literal):
+                detected_ports.add(port)
+
+        # Nothing left to find
+        if len(detected_ports) == len(_PORT_LITERALS):
+            break
+
     return sorted(detected_ports)
 
 
@@ -149,115 +236,145 @@ def infer_project_type(path: Path = Path.cwd()) -> str:
     Returns:
         'notebook' if notebooks are present, 'webapp' otherwise.
     """
+    index = _scan_dir(path)
+
     # Check for notebooks
-    notebooks = list(path.glob("*.ipynb"))
-    if notebooks:
+    if index.ipynb_files:
         return "notebook"
 
     # Check for webapp entry files
-    for entry in WEBAPP_ENTRY_FILES:
-        if (path / entry).exists():
-            return "webapp"
+    if not WEBAPP_ENTRY_SET.isdisjoint(index.names):
+        return "webapp"
 
     # Default to notebook
     return "notebook"
 
 
-def detect_current_gpu() -> str:
-    """Detect GPU type from nvidia-smi on current machine.
-    
+# nvidia-smi name substrings -> Brev GPU type, most specific first: "a100" must
+# be tried before "a10", and the 80GB A100 before the 40GB one (an "H100 80GB"
+# must not match the A100 80GB entry, hence both needles).
+_GPU_NAME_MAP: tuple[tuple[tuple[str, ...], str], ...] = (
+    (("a100", "80gb"), "gpu_1x_a100_80gb"),
+    (("a100",), "gpu_1x_a100"),
+    (("h100",), "gpu_1x_h100"),
+    (("v100",), "gpu_1x_v100"),
+    (("a10",), "gpu_1x_a10"),
+    (("t4",), "gpu_1x_t4"),
+)
+
+
+def _query_nvml() -> Optional[tuple[Optional[str], Optional[float]]]:
+    """Query GPU name and memory in-process through NVML.
+
+    Requires the optional ``nvidia-ml-py`` package (``brev-launcher[gpu]``).
+
     Returns:
-        Brev GPU type string (e.g., 'gpu_1x_a10') or 'any' if not detected.
+        Same tuple as _query_nvidia_smi, or None if NVML could not be
+        loaded or initialised.
     """
     try:
-        result = subprocess.run(
-            ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        
-        if result.returncode != 0:
-            return "any"
-        
-        gpu_name = result.stdout.strip().lower()
-        
-        # Map GPU names to Brev GPU types
-        if "a10" in gpu_name:
-            return "gpu_1x_a10"
-        elif "a100" in gpu_name:
-            if "80gb" in gpu_name:
-                return "gpu_1x_a100_80gb"
-            return "gpu_1x_a100"
-        elif "t4" in gpu_name:
-            return "gpu_1x_t4"
-        elif "v100" in gpu_name:
-            return "gpu_1x_v100"
-        elif "h100" in gpu_name:
-            return "gpu_1x_h100"
-        else:
-            return "any"
-            
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        return "any"
+        import pynvml
+    except ImportError:
+        return None
 
+    try:
+        pynvml.nvmlInit()
+    except pynvml.NVMLError:
+        return None
+
+    # Once NVML is up its answer is final; nvidia-smi reads the same library
+    try:
+        if pynvml.nvmlDeviceGetCount() == 0:
+            return None, None
+        handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+        name = pynvml.nvmlDeviceGetName(handle)
+        memory_bytes = pynvml.nvmlDeviceGetMemoryInfo(handle).total
+    except pynvml.NVMLError:
+        return None, None
+    finally:
+        # A failed shutdown must not turn a good answer into an exception
+        try:
+            pynvml.nvmlShutdown()
+        except pynvml.NVMLError:
+            pass
+
+    # Older bindings return the name as bytes
+    if isinstance(name, bytes):
+        name = name.decode(errors="ignore")
+    return name.strip().lower() or None, round(memory_bytes / 1024**3, 1)
+
+
+@functools.lru_cache(maxsize=1)
+def _query_nvidia_smi() -> tuple[Optional[str], Optional[float]]:
+    """Query GPU name and memory with a single nvidia-smi call.
+
+    Uses NVML directly when available to avoid spawning nvidia-smi.
+    Cached for the life of the process; the GPU does not change under us.
 
-def get_gpu_memory_gb() -> Optional[float]:
-    """Get GPU memory in GB from nvidia-smi.
-    
     Returns:
-        GPU memory in GB, or None if not available.
+        Tuple of (lower-cased GPU name, memory in GB) for the first GPU,
+        with None for anything that could not be read.
     """
+    nvml_result = _query_nvml()
+    if nvml_result is not None:
+        return nvml_result
+
     try:
         result = subprocess.run(
-            ["nvidia-smi", "--query-gpu=memory.total", "--format=csv,noheader,nounits"],
+            ["nvidia-smi", "--query-gpu=name,memory.total", "--format=csv,noheader,nounits"],
             capture_output=True,
             text=True,
             timeout=5,
         )
-        
-        if result.returncode != 0:
-            return None
-        
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return None, None
+
+    if result.returncode != 0 or not result.stdout.strip():
+        return None, None
+
+    # One row per GPU: "NVIDIA A10G, 23028"
+    first_row = result.stdout.strip().splitlines()[0]
+    name, _, memory = first_row.rpartition(",")
+    try:
         # Memory is returned in MiB, convert to GB
-        memory_mib = float(result.stdout.strip())
-        return round(memory_mib / 1024, 1)
-        
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError, ValueError):
-        return None
+        memory_gb = round(float(memory) / 1024, 1)
+    except ValueError:
+        memory_gb = None
 
+    return name.strip().lower() or None, memory_gb
 
-def estimate_vram_usage(path: Path = Path.cwd()) -> Optional[float]:
-    """Estimate VRAM usage by scanning code and dependencies.
-    
-    Looks for common ML models and frameworks to estimate memory requirements.
+
+def detect_current_gpu() -> str:
+    """Detect GPU type from nvidia-smi on current machine.
     
-    Args:
-        path: Project directory path.
-        
     Returns:
-        Estimated VRAM in GB, or None if cannot estimate.
+        Brev GPU type string (e.g., 'gpu_1x_a10') or 'any' if not detected.
     """
-    result = estimate_vram_usage_detailed(path)
-    return result["estimated_vram"] if result else None
+    gpu_name, _ = _query_nvidia_smi()
+    if gpu_name is None:
+        return "any"
 
+    # Map GPU names to Brev GPU types
+    for needles, gpu_type in _GPU_NAME_MAP:
+        if all(needle in gpu_name for needle in needles):
+            return gpu_type
+    return "any"
 
-def estimate_vram_usage_detailed(path: Path = Path.cwd()) -> Optional[dict]:
-    """Estimate VRAM usage with detailed detection information.
+
+def get_gpu_memory_gb() -> Optional[float]:
+    """Get GPU memory in GB from nvidia-smi.
     
-    Args:
-        path: Project directory path.
-        
     Returns:
-        Dictionary with:
-        - estimated_vram: float (final estimate with buffer)
-        - base_vram: float (base model requirement)
-        - detected_models: list of {model, vram, file}
-        - frameworks: list of detected frameworks
-        Or None if cannot estimate.
+        GPU memory in GB, or None if not available.
     """
-    # Model size patterns (model name -> estimated VRAM in GB)
-    model_patterns = {
+    _, memory_gb = _query_nvidia_smi()
+    return memory_gb
+
+
+# Model name patterns -> (display name, estimated VRAM in GB), compiled once
+_MODEL_PATTERNS: tuple[tuple[re.Pattern[str], str, float], ...] = tuple(
+    (re.compile(pattern), model_name, vram)
+    for pattern, (model_name, vram) in {
         # LLM models
         r'gpt-?2|gpt2': ("GPT-2", 2.0),
         r'gpt-?3\.5|gpt3': ("GPT-3.5", 4.0),
@@ -266,18 +383,18 @@ def estimate_vram_usage_detailed(path: Path = Path.cwd()) -> Optional[dict]:
         r'llama.*70b|70b.*model': ("LLaMA 70B", 140.0),
         r'mistral.*7b': ("Mistral 7B", 14.0),
         r'mixtral.*8x7b': ("Mixtral 8x7B", 90.0),
-        
+
         # Stable Diffusion
         r'stable.*diffusion.*1\.5|sd.*1\.5|runwayml': ("Stable Diffusion 1.5", 6.0),
         r'stable.*diffusion.*xl|sdxl': ("Stable Diffusion XL", 12.0),
         r'stable.*diffusion.*2|sd.*2\.': ("Stable Diffusion 2", 8.0),
-        
+
         # Whisper models
         r'whisper.*large': ("Whisper Large", 10.0),
         r'whisper.*medium': ("Whisper Medium", 5.0),
         r'whisper.*small': ("Whisper Small", 2.0),
         r'whisper.*base': ("Whisper Base", 1.0),
-        
+
         # Other common models
         r'bert.*large': ("BERT Large", 3.0),
         r'bert.*base': ("BERT Base", 1.5),
@@ -285,102 +402,223 @@ def estimate_vram_usage_detailed(path: Path = Path.cwd()) -> Optional[dict]:
         r't5.*xl': ("T5 XL", 11.0),
         r'yolo.*v8': ("YOLOv8", 2.0),
         r'sam|segment.*anything': ("Segment Anything (SAM)", 6.0),
-    }
+    }.items()
+)
+# No file can raise the estimate past the largest known model
+_MAX_MODEL_VRAM = max(vram for _, _, vram in _MODEL_PATTERNS)
+# Import statements that identify each framework in source code
+_FRAMEWORK_IMPORTS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("PyTorch", ("import torch", "from torch")),
+    ("TensorFlow", ("import tensorflow", "from tensorflow")),
+    ("JAX", ("import jax", "from jax")),
+    ("Diffusers", ("import diffusers", "from diffusers")),
+    ("Transformers", ("import transformers", "from transformers")),
+)
+
+
+# Directories that never hold project code worth scanning
+_SKIP_SCAN_DIRS = frozenset(
+    {".git", ".venv", "venv", "node_modules", "__pycache__", "site-packages", ".tox"}
+)
+# Files are read in blocks of whole lines so large files never sit in memory
+_SCAN_BLOCK_BYTES = 1024 * 1024
+# Below this many files, thread start-up costs more than it saves
+_PARALLEL_SCAN_MIN_FILES = 8
+
+
+def _iter_py_files(root: str) -> Iterator[str]:
+    """Yield paths of Python files under root, skipping environment dirs."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Prune in place so os.walk never descends into them
+        dirnames[:] = sorted(d for d in dirnames if d not in _SKIP_SCAN_DIRS)
+        for name in sorted(filenames):
+            if name.endswith(".py") and not name.startswith("."):
+                yield os.path.join(dirpath, name)
+
+
+def _scan_source_file(file_path: str) -> tuple[dict[str, float], set[str]]:
+    """Find model patterns and framework imports in one Python file.
+
+    Every pattern matches within a single line, so scanning block by block
+    gives the same result as a whole-file read.
+
+    Returns:
+        Tuple of ({model name: VRAM in GB}, framework names); both empty if
+        the file cannot be read.
+    """
+    models: dict[str, float] = {}
+    frameworks: set[str] = set()
+    try:
+        with open(file_path, "rb") as f:
+            # A NUL byte early on means a binary file misnamed .py; skip it
+            if b"\0" in f.read(4096):
+                return models, frameworks
+            f.seek(0)
+            for lines in iter(lambda: f.readlines(_SCAN_BLOCK_BYTES), []):
+                content = b"".join(lines).decode("utf-8", "ignore").lower()
+                for model_name, vram in _find_models(content):
+                    models.setdefault(model_name, vram)
+                for framework, imports in _FRAMEWORK_IMPORTS:
+                    if any(statement in content for statement in imports):
+                        frameworks.add(framework)
+    except OSError:
+        return {}, set()
+    return models, frameworks
+
+
+def _read_lower(path: Path, name: str) -> str:
+    """Read a top-level project file lower-cased, or "" if it is missing."""
+    if name not in _scan_dir(path).names:
+        return ""
+    try:
+        return (path / name).read_text(errors="ignore").lower()
+    except OSError:
+        return ""
+
+
+def _pyproject_dependencies(text: str) -> str:
+    """Reduce pyproject.toml text to its dependency specifiers.
+
+    Falls back to the full text when tomllib (Python 3.11+) is unavailable
+    or the file does not parse.
+    """
+    if not text:
+        return text
+    try:
+        import tomllib
+    except ImportError:
+        return text
+    try:
+        data = tomllib.loads(text)
+    except tomllib.TOMLDecodeError:
+        return text
+
+    project = data.get("project", {})
+    deps = list(project.get("dependencies", []))
+    for extra in project.get("optional-dependencies", {}).values():
+        deps.extend(extra)
+    deps.extend(data.get("tool", {}).get("poetry", {}).get("dependencies", {}))
+    return "\n".join(dep for dep in deps if isinstance(dep, str))
+
+
+def _find_models(content: str) -> list[tuple[str, float]]:
+    """Return (model name, VRAM in GB) for every model pattern in content.
+
+    Expects lower-cased content. Separate searches are faster here than one
+    merged alternation or re.IGNORECASE, which lose re's literal-prefix scan.
+    """
+    return [
+        (model_name, vram)
+        for pattern, model_name, vram in _MODEL_PATTERNS
+        if pattern.search(content)
+    ]
+
+
+def estimate_vram_usage(path: Path = Path.cwd()) -> Optional[float]:
+    """Estimate VRAM usage by scanning code and dependencies.
+    
+    Looks for common ML models and frameworks to estimate memory requirements.
     
+    Args:
+        path: Project directory path.
+        
+    Returns:
+        Estimated VRAM in GB, or None if cannot estimate.
+    """
+    result = _estimate_vram(path, stop_at_max=True)
+    return result["estimated_vram"] if result else None
+
+
+def estimate_vram_usage_detailed(path: Path = Path.cwd()) -> Optional[dict]:
+    """Estimate VRAM usage with detailed detection information.
+    
+    Args:
+        path: Project directory path.
+        
+    Returns:
+        Dictionary with:
+        - estimated_vram: float (final estimate with buffer)
+        - base_vram: float (base model requirement)
+        - detected_models: list of {model, vram, file}
+        - frameworks: list of detected frameworks
+        Or None if cannot estimate.
+    """
+    return _estimate_vram(path, stop_at_max=False)
+
+
+def _estimate_vram(path: Path, stop_at_max: bool) -> Optional[dict]:
+    """Scan path for models and frameworks.
+
+    With ``stop_at_max`` the file scan ends once the largest known model is
+    found, which fixes the estimate but leaves the detection lists partial.
+    """
     detected_models = []
     max_vram = 0.0
     frameworks = set()
     
     # Scan Python files
-    for py_file in path.rglob("*.py"):
-        if py_file.name.startswith("."):
-            continue
-        try:
-            content = py_file.read_text(errors='ignore').lower()
-            for pattern, (model_name, vram) in model_patterns.items():
-                if re.search(pattern, content):
-                    detected_models.append({
-                        "model": model_name,
-                        "vram": vram,
-                        "file": str(py_file.relative_to(path)),
-                    })
-                    max_vram = max(max_vram, vram)
-            
-            # Detect frameworks
-            if 'import torch' in content or 'from torch' in content:
-                frameworks.add('PyTorch')
-            if 'import tensorflow' in content or 'from tensorflow' in content:
-                frameworks.add('TensorFlow')
-            if 'import jax' in content or 'from jax' in content:
-                frameworks.add('JAX')
-            if 'from diffusers' in content or 'import diffusers' in content:
-                frameworks.add('Diffusers')
-            if 'import transformers' in content or 'from transformers' in content:
-                frameworks.add('Transformers')
-        except Exception:
-            continue
-    
-    # Scan requirements.txt
-    req_file = path / "requirements.txt"
-    if req_file.exists():
-        try:
-            content = req_file.read_text(errors='ignore').lower()
-            for pattern, (model_name, vram) in model_patterns.items():
-                if re.search(pattern, content):
-                    detected_models.append({
-                        "model": model_name,
-                        "vram": vram,
-                        "file": "requirements.txt",
-                    })
-                    max_vram = max(max_vram, vram)
-            
-            # Detect frameworks in requirements
-            if 'torch' in content:
-                frameworks.add('PyTorch')
-            if 'tensorflow' in content:
-                frameworks.add('TensorFlow')
-            if 'diffusers' in content:
-                frameworks.add('Diffusers')
-            if 'transformers' in content:
-                frameworks.add('Transformers')
-        except Exception:
-            pass
+    root = os.fspath(path)
+    file_paths = list(_iter_py_files(root))
+
+    # Reads overlap in threads; results are consumed in walk order so the
+    # reported files stay deterministic
+    pool = None
+    if len(file_paths) >= _PARALLEL_SCAN_MIN_FILES:
+        pool = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+    try:
+        results = (pool.map if pool else map)(_scan_source_file, file_paths)
+        for file_path, (file_models, file_frameworks) in zip(file_paths, results):
+            for model_name, vram in file_models.items():
+                detected_models.append({
+                    "model": model_name,
+                    "vram": vram,
+                    "file": os.path.relpath(file_path, root),
+                })
+                max_vram = max(max_vram, vram)
+            frameworks.update(file_frameworks)
+
+            if stop_at_max and max_vram >= _MAX_MODEL_VRAM:
+                break
+    finally:
+        if pool:
+            pool.shutdown(wait=False, cancel_futures=True)
     
-    # Scan pyproject.toml
-    pyproject = path / "pyproject.toml"
-    if pyproject.exists():
-        try:
-            content = pyproject.read_text(errors='ignore').lower()
-            for pattern, (model_name, vram) in model_patterns.items():
-                if re.search(pattern, content):
-                    detected_models.append({
-                        "model": model_name,
-                        "vram": vram,
-                        "file": "pyproject.toml",
-                    })
-                    max_vram = max(max_vram, vram)
-        except Exception:
-            pass
+    # Each dependency file is read once; the framework baseline below reuses it
+    req_text = _read_lower(path, "requirements.txt")
+    pyproject_text = _pyproject_dependencies(_read_lower(path, "pyproject.toml"))
+
+    for file_name, content in (
+        ("requirements.txt", req_text),
+        ("pyproject.toml", pyproject_text),
+    ):
+        for model_name, vram in _find_models(content):
+            detected_models.append({
+                "model": model_name,
+                "vram": vram,
+                "file": file_name,
+            })
+            max_vram = max(max_vram, vram)
+
+    # Detect frameworks in requirements
+    if 'torch' in req_text:
+        frameworks.add('PyTorch')
+    if 'tensorflow' in req_text:
+        frameworks.add('TensorFlow')
+    if 'diffusers' in req_text:
+        frameworks.add('Diffusers')
+    if 'transformers' in req_text:
+        frameworks.add('Transformers')
     
     # Check for common frameworks (gives us a baseline)
     if max_vram == 0:
-        try:
-            all_content = ""
-            if req_file.exists():
-                all_content += req_file.read_text(errors='ignore').lower()
-            if pyproject.exists():
-                all_content += pyproject.read_text(errors='ignore').lower()
-            
-            # If has torch/tensorflow but no specific model, estimate 4GB baseline
-            if any(fw in all_content for fw in ['torch', 'tensorflow', 'jax']):
-                max_vram = 4.0
-                detected_models.append({
-                    "model": "Generic ML Framework",
-                    "vram": 4.0,
-                    "file": "requirements.txt (baseline)",
-                })
-        except Exception:
-            pass
+        # If has torch/tensorflow but no specific model, estimate 4GB baseline
+        if any(fw in req_text + pyproject_text for fw in ['torch', 'tensorflow', 'jax']):
+            max_vram = 4.0
+            detected_models.append({
+                "model": "Generic ML Framework",
+                "vram": 4.0,
+                "file": "requirements.txt (baseline)",
+            })
     
     # Return None if no models detected
     if max_vram == 0:
@@ -1,10 +1,21 @@
 """Git information extraction and URL normalization."""
 
+import functools
+import os
 import re
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+_GIT_SUFFIX_RE = re.compile(r"\.git$")
+_SSH_URL_RE = re.compile(r"git@([^:]+):(.+)")
+_GIT_PROTOCOL_RE = re.compile(r"git://([^/]+)/(.+)")
+_CONFIG_SECTION_RE = re.compile(r"\s*\[([^\]]*)\]")
+_CONFIG_URL_RE = re.compile(r"\s*url\s*=\s*([^#;]+)")
+_CONFIG_NEEDS_GIT_RE = re.compile(r"(?i)insteadof|\[\s*include")
 
 
 @dataclass
@@ -23,23 +34,133 @@ class GitError(Exception):
     pass
 
 
-def is_git_repo(path: Path = Path.cwd()) -> bool:
-    """Check if the given path is inside a git repository."""
+_git_caches: list[Callable[[], None]] = []
+
+# Files under .git whose changes can alter a cached answer
+_GIT_STATE_FILES = ("config", "HEAD", "packed-refs", "refs/heads", "refs/remotes/origin/HEAD")
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Return the modification time of path, or None if it is missing."""
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--git-dir"],
-            cwd=path,
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        return False
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _git_state(path: Path) -> tuple:
+    """Stamp the git metadata that queries for path depend on.
+
+    The stamp changes after ``git init``, remote edits and branch changes.
+    For worktrees and submodules only the ``.git`` file itself is stamped.
+    """
+    for directory in (path, *path.parents):
+        git_path = directory / ".git"
+        if git_path.is_dir():
+            return (directory, *(_mtime_ns(git_path / name) for name in _GIT_STATE_FILES))
+        if git_path.exists():
+            return (directory, _mtime_ns(git_path))
+    return ()
+
+
+def _memoize_by_path(func: Callable[[Path], T]) -> Callable[[Optional[Path]], T]:
+    """Cache a git query per resolved repository path.
+
+    Entries are keyed on the path and a stamp of its ``.git`` metadata, so
+    repeat queries skip spawning git while repository changes made since
+    the last query are still picked up. ``path`` defaults to the current
+    directory at call time.
+    """
+    cached = functools.lru_cache(maxsize=32)(lambda path_str, state: func(Path(path_str)))
+    _git_caches.append(cached.cache_clear)
 
+    @functools.wraps(func)
+    def wrapper(path: Optional[Path] = None) -> T:
+        resolved = Path.cwd() if path is None else Path(path).resolve()
+        return cached(os.fspath(resolved), _git_state(resolved))
+
+    return wrapper
+
+
+def clear_git_caches() -> None:
+    """Forget all cached git query results."""
+    for cache_clear in _git_caches:
+        cache_clear()
+
+
+@_memoize_by_path
+def is_git_repo(path: Path) -> bool:
+    """Check if the given path is inside a git repository."""
+    return probe_git(path)[0]
 
-def get_origin_url(path: Path = Path.cwd()) -> Optional[str]:
+
+@_memoize_by_path
+def get_origin_url(path: Path) -> Optional[str]:
     """Get the origin remote URL."""
+    return probe_git(path)[1]
+
+
+def _find_git_dir(path: Path) -> Optional[Path]:
+    """Find the ``.git`` directory for path by walking up its parents.
+
+    Returns None when there is no plain ``.git`` directory, including
+    worktrees and submodules where ``.git`` is a file; callers then fall
+    back to asking git itself.
+    """
+    for directory in (path, *path.parents):
+        git_dir = directory / ".git"
+        if git_dir.is_dir():
+            return git_dir
+        if git_dir.exists():
+            return None
+    return None
+
+
+def _read_origin_from_config(git_dir: Path) -> tuple[bool, Optional[str]]:
+    """Read the origin URL straight from ``.git/config``.
+
+    Returns:
+        Tuple of (parsed, origin_url). ``parsed`` is False when the config
+        uses includes or URL rewrites that only git can resolve.
+    """
+    try:
+        config = (git_dir / "config").read_text(errors="ignore")
+    except OSError:
+        return False, None
+    if _CONFIG_NEEDS_GIT_RE.search(config):
+        return False, None
+
+    in_origin = False
+    for line in config.splitlines():
+        section = _CONFIG_SECTION_RE.match(line)
+        if section:
+            in_origin = section.group(1) == 'remote "origin"'
+            continue
+        if in_origin:
+            url = _CONFIG_URL_RE.match(line)
+            if url:
+                return True, url.group(1).strip()
+    return True, None
+
+
+@_memoize_by_path
+def probe_git(path: Path) -> tuple[bool, Optional[str]]:
+    """Check for a git repo and read the origin URL.
+
+    Reads ``.git/config`` directly when possible. Otherwise makes a single
+    ``git remote get-url origin`` call, which exits 0 with the URL, 2 when
+    the repo has no origin remote, and 128 (fatal) when ``path`` is not in a
+    repository.
+
+    Returns:
+        Tuple of (is_git_repo, origin_url).
+    """
+    git_dir = _find_git_dir(path)
+    if git_dir is not None:
+        parsed, origin_url = _read_origin_from_config(git_dir)
+        if parsed:
+            return True, origin_url
+
     try:
         result = subprocess.run(
             ["git", "remote", "get-url", "origin"],
@@ -48,13 +169,15 @@ def get_origin_url(path: Path = Path.cwd()) -> Optional[str]:
             text=True,
             timeout=10,
         )
-        if result.returncode == 0:
-            return result.stdout.strip()
-        return None
     except (subprocess.TimeoutExpired, FileNotFoundError):
-        return None
+        return False, None
 
+    if result.returncode == 0:
+        return True, result.stdout.strip()
+    return result.returncode != 128, None
 
+
+@functools.lru_cache(maxsize=128)
 def normalize_git_url(url: str) -> str:
     """Normalize a git URL to HTTPS GitHub format.
 
@@ -64,16 +187,16 @@ def normalize_git_url(url: str) -> str:
     - git://github.com/user/repo.git -> https://github.com/user/repo
     """
     # Remove trailing .git
-    url = re.sub(r"\.git$", "", url)
+    url = _GIT_SUFFIX_RE.sub("", url)
 
     # SSH format: git@github.com:user/repo
-    ssh_match = re.match(r"git@([^:]+):(.+)", url)
+    ssh_match = _SSH_URL_RE.match(url)
     if ssh_match:
         host, path = ssh_match.groups()
         return f"https://{host}/{path}"
 
     # Git protocol: git://github.com/user/repo
-    git_match = re.match(r"git://([^/]+)/(.+)", url)
+    git_match = _GIT_PROTOCOL_RE.match(url)
     if git_match:
         host, path = git_match.groups()
         return f"https://{host}/{path}"
@@ -85,8 +208,37 @@ def normalize_git_url(url: str) -> str:
     return url
 
 
-def get_default_branch(path: Path = Path.cwd()) -> str:
+def _read_default_branch(git_dir: Path) -> Optional[str]:
+    """Read the default branch from ref files without spawning git."""
+    try:
+        # refs/remotes/origin/HEAD holds "ref: refs/remotes/origin/main"
+        head = (git_dir / "refs" / "remotes" / "origin" / "HEAD").read_text().strip()
+        if head.startswith("ref: "):
+            return head.split("/")[-1]
+    except OSError:
+        pass
+
+    try:
+        packed_refs = (git_dir / "packed-refs").read_text(errors="ignore")
+    except OSError:
+        packed_refs = ""
+    for branch in ["main", "master"]:
+        if (git_dir / "refs" / "heads" / branch).is_file():
+            return branch
+        if f" refs/heads/{branch}\n" in packed_refs:
+            return branch
+    return None
+
+
+@_memoize_by_path
+def get_default_branch(path: Path) -> str:
     """Get the default branch name."""
+    git_dir = _find_git_dir(path)
+    if git_dir is not None:
+        branch = _read_default_branch(git_dir)
+        if branch:
+            return branch
+
     # Try to get from remote HEAD
     try:
         result = subprocess.run(
@@ -121,23 +273,26 @@ def get_default_branch(path: Path = Path.cwd()) -> str:
     return "main"
 
 
+@functools.lru_cache(maxsize=128)
 def extract_repo_name(url: str) -> str:
     """Extract repository name from URL."""
     # Remove .git suffix
-    url = re.sub(r"\.git$", "", url)
+    url = _GIT_SUFFIX_RE.sub("", url)
 
     # Get last path component
     parts = url.rstrip("/").split("/")
     return parts[-1] if parts else "project"
 
 
-def get_git_info(path: Path = Path.cwd()) -> GitInfo:
+@_memoize_by_path
+def get_git_info(path: Path) -> GitInfo:
     """Get complete git information for the repository.
 
     Raises:
         GitError: If not a git repo or origin is missing.
     """
-    if not is_git_repo(path):
+    in_repo, origin_url = probe_git(path)
+    if not in_repo:
         raise GitError(
             "Not a git repository.\n\n"
             "Fix: Initialize a git repository:\n"
@@ -147,7 +302,6 @@ def get_git_info(path: Path = Path.cwd()) -> GitInfo:
             "  git remote add origin <your-repo-url>"
         )
 
-    origin_url = get_origin_url(path)
     if not origin_url:
         raise GitError(
             "No 'origin' remote found.\n\n"
@@ -1,5 +1,6 @@
 """Pydantic schemas for Brev Launchable configuration."""
 
+import functools
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -64,6 +65,15 @@ class NetworkingConfig(BaseModel):
 
     ports: list[int] = Field(default_factory=list)
 
+    def add_port(self, port: int) -> None:
+        """Expose a port, keeping first-added order and skipping duplicates.
+
+        A list rather than a set keeps the YAML output in the order ports
+        were configured; it only ever holds a handful of entries.
+        """
+        if port not in self.ports:
+            self.ports.append(port)
+
 
 class FilesConfig(BaseModel):
     """Files configuration."""
@@ -71,13 +81,20 @@ class FilesConfig(BaseModel):
     include: list[str] = Field(default_factory=lambda: ["."])
 
 
+@functools.lru_cache(maxsize=1)
+def _run_timestamp() -> str:
+    """Timestamp of the first config generated in this process.
+
+    Every config from one launcher run shares a single generated_at value.
+    """
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
 class MetadataConfig(BaseModel):
     """Metadata about generation."""
 
     generated_by: str = "brev-launcher"
-    generated_at: str = Field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat(timespec="seconds")
-    )
+    generated_at: str = Field(default_factory=_run_timestamp)
 
 
 class LaunchableConfig(BaseModel):
@@ -98,14 +115,14 @@ class LaunchableConfig(BaseModel):
         port: int = 8888,
     ) -> "LaunchableConfig":
         """Configure for notebook mode."""
-        self.runtime.start.notebook = NotebookConfig(
+        # Arguments are already typed; skip re-validating the nested model
+        self.runtime.start.notebook = NotebookConfig.model_construct(
             enable_jupyter=True,
             command=command,
             port=port,
         )
         self.runtime.start.webapp = None
-        if port not in self.networking.ports:
-            self.networking.ports.append(port)
+        self.networking.add_port(port)
         return self
 
     def with_webapp(
@@ -114,13 +131,12 @@ class LaunchableConfig(BaseModel):
         port: int = 7860,
     ) -> "LaunchableConfig":
         """Configure for webapp mode."""
-        self.runtime.start.webapp = WebappConfig(
+        self.runtime.start.webapp = WebappConfig.model_construct(
             expose_port=port,
             command=command,
         )
         self.runtime.start.notebook = None
-        if port not in self.networking.ports:
-            self.networking.ports.append(port)
+        self.networking.add_port(port)
         return self
 
     def with_install_command(self, command: str) -> "LaunchableConfig":
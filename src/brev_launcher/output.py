@@ -1,6 +1,8 @@
 """Terminal output formatting."""
 
+import functools
 from pathlib import Path
+from typing import Iterable
 
 from rich.console import Console
 from rich.markdown import Markdown
@@ -11,6 +13,34 @@ from .constants import BREV_DEPLOY_BADGE_URL, BREV_DEPLOY_URL_TEMPLATE
 
 console = Console()
 
+_NEXT_STEPS = """\
+1. **Commit and push** `launchable.yaml` to your repository
+
+2. **Create a Launchable** in Brev:
+   - Go to [Brev Console](https://brev.nvidia.com)
+   - Navigate to **Launchables** → **Create Launchable**
+   - Select **Git Repository**
+   - Click **Show configuration**
+   - Paste the contents of `launchable.yaml`
+
+3. **Deploy** your Launchable to a GPU instance
+
+4. **Verify** your notebook opens or app responds
+"""
+
+_SMOKE_TEST_CHECKLIST = """\
+- [ ] Create Launchable from config in Brev console
+- [ ] Deploy to a fresh GPU instance
+- [ ] Confirm notebook opens or app responds
+- [ ] Test GPU access (run `torch.cuda.is_available()`)
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _markdown(text: str) -> Markdown:
+    """Parse constant Markdown once; the renderable can be printed repeatedly."""
+    return Markdown(text)
+
 
 def print_success(message: str) -> None:
     """Print a success message."""
@@ -49,21 +79,7 @@ def print_next_steps(launchable_path: Path) -> None:
     console.print("[bold cyan]━━━ Next Steps ━━━[/bold cyan]")
     console.print()
 
-    steps = """\
-1. **Commit and push** `launchable.yaml` to your repository
-
-2. **Create a Launchable** in Brev:
-   - Go to [Brev Console](https://brev.nvidia.com)
-   - Navigate to **Launchables** → **Create Launchable**
-   - Select **Git Repository**
-   - Click **Show configuration**
-   - Paste the contents of `launchable.yaml`
-
-3. **Deploy** your Launchable to a GPU instance
-
-4. **Verify** your notebook opens or app responds
-"""
-    console.print(Markdown(steps))
+    console.print(_markdown(_NEXT_STEPS))
 
 
 def print_badge_snippet(launchable_id: str = "env-REPLACE_ME") -> None:
@@ -106,20 +122,20 @@ def print_smoke_test_checklist() -> None:
     console.print("[bold cyan]━━━ Smoke Test Checklist ━━━[/bold cyan]")
     console.print()
 
-    checklist = """\
-- [ ] Create Launchable from config in Brev console
-- [ ] Deploy to a fresh GPU instance
-- [ ] Confirm notebook opens or app responds
-- [ ] Test GPU access (run `torch.cuda.is_available()`)
-"""
-    console.print(Markdown(checklist))
+    console.print(_markdown(_SMOKE_TEST_CHECKLIST))
 
 
-def print_doctor_results(checks: list[tuple[str, bool, str]]) -> None:
+def print_doctor_results(checks: Iterable[tuple[str, bool, str]]) -> bool:
     """Print doctor command results.
 
+    Checks are printed as they are produced, so a generator that runs each
+    check lazily shows progress instead of a blank screen.
+
     Args:
-        checks: List of (check_name, passed, message) tuples.
+        checks: Iterable of (check_name, passed, message) tuples.
+
+    Returns:
+        True if every check passed.
     """
     console.print()
     console.print("[bold cyan]━━━ Project Health Check ━━━[/bold cyan]")
@@ -139,14 +155,22 @@ def print_doctor_results(checks: list[tuple[str, bool, str]]) -> None:
     else:
         print_warning("Some checks failed. See above for details.")
 
+    return all_passed
+
 
 def print_yaml_preview(yaml_content: str, max_lines: int = 50) -> None:
     """Print a preview of the YAML content."""
-    lines = yaml_content.split("\n")
-    if len(lines) > max_lines:
-        preview = "\n".join(lines[:max_lines]) + "\n# ... (truncated)"
-    else:
+    # Find the end of the first max_lines lines without splitting the rest
+    end = -1
+    for _ in range(max_lines):
+        end = yaml_content.find("\n", end + 1)
+        if end == -1:
+            break
+
+    if end == -1:
         preview = yaml_content
+    else:
+        preview = yaml_content[:end] + "\n# ... (truncated)"
 
     console.print()
     console.print("[bold]Generated launchable.yaml:[/bold]")
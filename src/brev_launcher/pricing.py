@@ -1,5 +1,6 @@
 """GPU pricing and cost estimation for Brev deployments."""
 
+import functools
 from typing import Dict, Optional
 
 # Brev GPU pricing (as of 2024)
@@ -55,6 +56,14 @@ GPU_PRICING: Dict[str, Dict] = {
     },
 }
 
+# Concrete GPUs (no "any" placeholder), cheapest first
+GPU_PRICING_SORTED: tuple[tuple[str, Dict], ...] = tuple(
+    sorted(
+        ((gpu_id, info) for gpu_id, info in GPU_PRICING.items() if gpu_id != "any"),
+        key=lambda item: item[1]["cost_per_hour"],
+    )
+)
+
 
 def calculate_monthly_cost(hourly_cost: float, hours_per_day: int = 24) -> float:
     """Calculate monthly cost from hourly rate.
@@ -94,6 +103,16 @@ def get_gpu_info(gpu_type: str) -> Optional[Dict]:
     return GPU_PRICING.get(gpu_type)
 
 
+@functools.lru_cache(maxsize=256)
+def _suitable_gpus(required_vram: float) -> tuple[tuple[str, Dict, float], ...]:
+    """GPUs with at least required_vram, cheapest first (memoized)."""
+    return tuple(
+        (gpu_id, info, info["compute_score"] / info["cost_per_hour"])
+        for gpu_id, info in GPU_PRICING_SORTED
+        if info["vram_gb"] >= required_vram
+    )
+
+
 def recommend_gpu(estimated_vram_gb: float, current_gpu: Optional[str] = None) -> Dict:
     """Recommend optimal GPU based on VRAM requirements.
     
@@ -102,22 +121,14 @@ def recommend_gpu(estimated_vram_gb: float, current_gpu: Optional[str] = None) -
         current_gpu: Current GPU type (optional).
         
     Returns:
-        Dictionary with recommendation details.
+        Dictionary with recommendation details. ``all_options`` lists
+        ``(gpu_id, info, cost_efficiency)`` tuples, cheapest first.
     """
     # Add 20% buffer for safety
     required_vram = estimated_vram_gb * 1.2
     
-    # Find GPUs that fit
-    suitable_gpus = []
-    for gpu_id, info in GPU_PRICING.items():
-        if gpu_id == "any":
-            continue
-        if info["vram_gb"] >= required_vram:
-            suitable_gpus.append({
-                "gpu_id": gpu_id,
-                "info": info,
-                "cost_efficiency": info["compute_score"] / info["cost_per_hour"],
-            })
+    # Find GPUs that fit, already cheapest first
+    suitable_gpus = _suitable_gpus(required_vram)
     
     if not suitable_gpus:
         return {
@@ -125,16 +136,13 @@ def recommend_gpu(estimated_vram_gb: float, current_gpu: Optional[str] = None) -
             "reason": "No GPU large enough for requirements",
         }
     
-    # Sort by cost (cheapest first)
-    suitable_gpus.sort(key=lambda x: x["info"]["cost_per_hour"])
-    
     # Recommend cheapest that fits
-    recommended = suitable_gpus[0]
+    recommended_id, recommended_info, _ = suitable_gpus[0]
     
     savings = None
     if current_gpu and current_gpu in GPU_PRICING:
         current_cost = GPU_PRICING[current_gpu]["cost_per_hour"]
-        recommended_cost = recommended["info"]["cost_per_hour"]
+        recommended_cost = recommended_info["cost_per_hour"]
         savings = {
             "hourly": current_cost - recommended_cost,
             "monthly": calculate_monthly_cost(current_cost - recommended_cost),
@@ -142,9 +150,9 @@ def recommend_gpu(estimated_vram_gb: float, current_gpu: Optional[str] = None) -
         }
     
     return {
-        "recommended": recommended["gpu_id"],
-        "info": recommended["info"],
+        "recommended": recommended_id,
+        "info": recommended_info,
         "savings": savings,
-        "all_options": suitable_gpus,
+        "all_options": list(suitable_gpus),
     }
 
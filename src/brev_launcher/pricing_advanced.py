@@ -3,11 +3,15 @@
 Source: https://brev.nvidia.com/environment/new (Jan 2, 2026)
 """
 
-from typing import TypedDict, List, Optional, Dict
+import functools
+import heapq
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, islice
+from typing import NamedTuple, List, Optional, Dict
 from .pricing import calculate_monthly_cost, calculate_yearly_cost
 
 
-class BrevInstance(TypedDict):
+class BrevInstance(NamedTuple):
     """Single Brev GPU instance configuration."""
     gpu_model: str              # e.g., "H100", "A100", "L40S", "T4"
     gpus: int                   # count of GPUs (1, 2, 4, 8, 10, 16)
@@ -21,139 +25,207 @@ class BrevInstance(TypedDict):
 # Complete Brev instance database (490 instances across 23 GPU types)
 BREV_INSTANCES: List[BrevInstance] = [
     # ============ B300 (4 instances) ============
-    {"gpu_model": "B300", "gpus": 1, "vram_per_gpu_gib": 288, "total_vram_gib": 288, "provider": "DATACRUNCH", "price_per_hour": 7.91, "cost_efficiency": 36.41},
-    {"gpu_model": "B300", "gpus": 2, "vram_per_gpu_gib": 288, "total_vram_gib": 576, "provider": "DATACRUNCH", "price_per_hour": 13.85, "cost_efficiency": 41.59},
-    {"gpu_model": "B300", "gpus": 4, "vram_per_gpu_gib": 288, "total_vram_gib": 1152, "provider": "DATACRUNCH", "price_per_hour": 25.73, "cost_efficiency": 44.77},
-    {"gpu_model": "B300", "gpus": 8, "vram_per_gpu_gib": 288, "total_vram_gib": 2304, "provider": "DATACRUNCH", "price_per_hour": 49.49, "cost_efficiency": 46.55},
+    BrevInstance("B300", 1, 288, 288, "DATACRUNCH", 7.91, 36.41),
+    BrevInstance("B300", 2, 288, 576, "DATACRUNCH", 13.85, 41.59),
+    BrevInstance("B300", 4, 288, 1152, "DATACRUNCH", 25.73, 44.77),
+    BrevInstance("B300", 8, 288, 2304, "DATACRUNCH", 49.49, 46.55),
     
     # ============ B200 (7 instances) ============
-    {"gpu_model": "B200", "gpus": 1, "vram_per_gpu_gib": 180, "total_vram_gib": 180, "provider": "LAMBDA-LABS", "price_per_hour": 6.35, "cost_efficiency": 28.35},
-    {"gpu_model": "B200", "gpus": 1, "vram_per_gpu_gib": 192, "total_vram_gib": 192, "provider": "DATACRUNCH", "price_per_hour": 6.76, "cost_efficiency": 28.40},
-    {"gpu_model": "B200", "gpus": 2, "vram_per_gpu_gib": 192, "total_vram_gib": 384, "provider": "DATACRUNCH", "price_per_hour": 11.54, "cost_efficiency": 33.28},
-    {"gpu_model": "B200", "gpus": 2, "vram_per_gpu_gib": 180, "total_vram_gib": 360, "provider": "LAMBDA-LABS", "price_per_hour": 12.46, "cost_efficiency": 28.89},
-    {"gpu_model": "B200", "gpus": 4, "vram_per_gpu_gib": 192, "total_vram_gib": 768, "provider": "DATACRUNCH", "price_per_hour": 21.12, "cost_efficiency": 36.36},
-    {"gpu_model": "B200", "gpus": 8, "vram_per_gpu_gib": 192, "total_vram_gib": 1536, "provider": "BOOSTRUN", "price_per_hour": 38.40, "cost_efficiency": 40.00},
-    {"gpu_model": "B200", "gpus": 8, "vram_per_gpu_gib": 192, "total_vram_gib": 1536, "provider": "DATACRUNCH", "price_per_hour": 40.27, "cost_efficiency": 38.15},
+    BrevInstance("B200", 1, 180, 180, "LAMBDA-LABS", 6.35, 28.35),
+    BrevInstance("B200", 1, 192, 192, "DATACRUNCH", 6.76, 28.40),
+    BrevInstance("B200", 2, 192, 384, "DATACRUNCH", 11.54, 33.28),
+    BrevInstance("B200", 2, 180, 360, "LAMBDA-LABS", 12.46, 28.89),
+    BrevInstance("B200", 4, 192, 768, "DATACRUNCH", 21.12, 36.36),
+    BrevInstance("B200", 8, 192, 1536, "BOOSTRUN", 38.40, 40.00),
+    BrevInstance("B200", 8, 192, 1536, "DATACRUNCH", 40.27, 38.15),
     
     # ============ RTX PRO 6000 (5 instances) ============
-    {"gpu_model": "RTX PRO 6000", "gpus": 1, "vram_per_gpu_gib": 96, "total_vram_gib": 96, "provider": "MASSEDCOMPUTE", "price_per_hour": 2.15, "cost_efficiency": 44.65},
-    {"gpu_model": "RTX PRO 6000", "gpus": 2, "vram_per_gpu_gib": 96, "total_vram_gib": 192, "provider": "MASSEDCOMPUTE", "price_per_hour": 4.30, "cost_efficiency": 44.65},
-    {"gpu_model": "RTX PRO 6000", "gpus": 4, "vram_per_gpu_gib": 96, "total_vram_gib": 384, "provider": "MASSEDCOMPUTE", "price_per_hour": 8.59, "cost_efficiency": 44.70},
-    {"gpu_model": "RTX PRO 6000", "gpus": 8, "vram_per_gpu_gib": 96, "total_vram_gib": 768, "provider": "BOOSTRUN", "price_per_hour": 11.62, "cost_efficiency": 66.09},
-    {"gpu_model": "RTX PRO 6000", "gpus": 8, "vram_per_gpu_gib": 96, "total_vram_gib": 768, "provider": "MASSEDCOMPUTE", "price_per_hour": 17.18, "cost_efficiency": 44.70},
+    BrevInstance("RTX PRO 6000", 1, 96, 96, "MASSEDCOMPUTE", 2.15, 44.65),
+    BrevInstance("RTX PRO 6000", 2, 96, 192, "MASSEDCOMPUTE", 4.30, 44.65),
+    BrevInstance("RTX PRO 6000", 4, 96, 384, "MASSEDCOMPUTE", 8.59, 44.70),
+    BrevInstance("RTX PRO 6000", 8, 96, 768, "BOOSTRUN", 11.62, 66.09),
+    BrevInstance("RTX PRO 6000", 8, 96, 768, "MASSEDCOMPUTE", 17.18, 44.70),
     
     # ============ H200 (7 instances) ============
-    {"gpu_model": "H200", "gpus": 1, "vram_per_gpu_gib": 141, "total_vram_gib": 141, "provider": "DIGITALOCEAN", "price_per_hour": 4.13, "cost_efficiency": 34.14},
-    {"gpu_model": "H200", "gpus": 1, "vram_per_gpu_gib": 141, "total_vram_gib": 141, "provider": "DATACRUNCH", "price_per_hour": 5.08, "cost_efficiency": 27.76},
-    {"gpu_model": "H200", "gpus": 2, "vram_per_gpu_gib": 141, "total_vram_gib": 282, "provider": "DATACRUNCH", "price_per_hour": 8.18, "cost_efficiency": 34.47},
-    {"gpu_model": "H200", "gpus": 4, "vram_per_gpu_gib": 141, "total_vram_gib": 564, "provider": "DATACRUNCH", "price_per_hour": 14.40, "cost_efficiency": 39.17},
-    {"gpu_model": "H200", "gpus": 8, "vram_per_gpu_gib": 141, "total_vram_gib": 1128, "provider": "BOOSTRUN", "price_per_hour": 23.52, "cost_efficiency": 47.96},
-    {"gpu_model": "H200", "gpus": 8, "vram_per_gpu_gib": 141, "total_vram_gib": 1128, "provider": "DATACRUNCH", "price_per_hour": 26.83, "cost_efficiency": 42.05},
-    {"gpu_model": "H200", "gpus": 8, "vram_per_gpu_gib": 141, "total_vram_gib": 1128, "provider": "DIGITALOCEAN", "price_per_hour": 33.02, "cost_efficiency": 34.16},
+    BrevInstance("H200", 1, 141, 141, "DIGITALOCEAN", 4.13, 34.14),
+    BrevInstance("H200", 1, 141, 141, "DATACRUNCH", 5.08, 27.76),
+    BrevInstance("H200", 2, 141, 282, "DATACRUNCH", 8.18, 34.47),
+    BrevInstance("H200", 4, 141, 564, "DATACRUNCH", 14.40, 39.17),
+    BrevInstance("H200", 8, 141, 1128, "BOOSTRUN", 23.52, 47.96),
+    BrevInstance("H200", 8, 141, 1128, "DATACRUNCH", 26.83, 42.05),
+    BrevInstance("H200", 8, 141, 1128, "DIGITALOCEAN", 33.02, 34.16),
     
     # ============ H100 (Top 30 most cost-effective) ============
     # Single GPU H100s
-    {"gpu_model": "H100", "gpus": 1, "vram_per_gpu_gib": 80, "total_vram_gib": 80, "provider": "HYPERSTACK", "price_per_hour": 2.28, "cost_efficiency": 35.09},
-    {"gpu_model": "H100", "gpus": 1, "vram_per_gpu_gib": 80, "total_vram_gib": 80, "provider": "VOLTAGEPARK", "price_per_hour": 2.39, "cost_efficiency": 33.47},
-    {"gpu_model": "H100", "gpus": 1, "vram_per_gpu_gib": 80, "total_vram_gib": 80, "provider": "DATACRUNCH", "price_per_hour": 2.71, "cost_efficiency": 29.52},
-    {"gpu_model": "H100", "gpus": 1, "vram_per_gpu_gib": 80, "total_vram_gib": 80, "provider": "IMWT", "price_per_hour": 2.98, "cost_efficiency": 26.85},
-    {"gpu_model": "H100", "gpus": 1, "vram_per_gpu_gib": 80, "total_vram_gib": 80, "provider": "LAMBDA-LABS", "price_per_hour": 2.99, "cost_efficiency": 26.76},
-    {"gpu_model": "H100", "gpus": 1, "vram_per_gpu_gib": 80, "total_vram_gib": 80, "provider": "CUDA", "price_per_hour": 3.18, "cost_efficiency": 25.16},
-    {"gpu_model": "H100", "gpus": 1, "vram_per_gpu_gib": 80, "total_vram_gib": 80, "provider": "MASSEDCOMPUTE", "price_per_hour": 3.58, "cost_efficiency": 22.35},
-    {"gpu_model": "H100", "gpus": 1, "vram_per_gpu_gib": 80, "total_vram_gib": 80, "provider": "SCALEWAY", "price_per_hour": 3.70, "cost_efficiency": 21.62},
-    {"gpu_model": "H100", "gpus": 1, "vram_per_gpu_gib": 80, "total_vram_gib": 80, "provider": "DIGITALOCEAN", "price_per_hour": 4.01, "cost_efficiency": 19.95},
+    BrevInstance("H100", 1, 80, 80, "HYPERSTACK", 2.28, 35.09),
+    BrevInstance("H100", 1, 80, 80, "VOLTAGEPARK", 2.39, 33.47),
+    BrevInstance("H100", 1, 80, 80, "DATACRUNCH", 2.71, 29.52),
+    BrevInstance("H100", 1, 80, 80, "IMWT", 2.98, 26.85),
+    BrevInstance("H100", 1, 80, 80, "LAMBDA-LABS", 2.99, 26.76),
+    BrevInstance("H100", 1, 80, 80, "CUDA", 3.18, 25.16),
+    BrevInstance("H100", 1, 80, 80, "MASSEDCOMPUTE", 3.58, 22.35),
+    BrevInstance("H100", 1, 80, 80, "SCALEWAY", 3.70, 21.62),
+    BrevInstance("H100", 1, 80, 80, "DIGITALOCEAN", 4.01, 19.95),
     
     # 2-GPU H100s
-    {"gpu_model": "H100", "gpus": 2, "vram_per_gpu_gib": 80, "total_vram_gib": 160, "provider": "HYPERSTACK", "price_per_hour": 4.56, "cost_efficiency": 35.09},
-    {"gpu_model": "H100", "gpus": 2, "vram_per_gpu_gib": 80, "total_vram_gib": 160, "provider": "VOLTAGEPARK", "price_per_hour": 4.78, "cost_efficiency": 33.47},
-    {"gpu_model": "H100", "gpus": 2, "vram_per_gpu_gib": 80, "total_vram_gib": 160, "provider": "IMWT", "price_per_hour": 5.95, "cost_efficiency": 26.89},
-    {"gpu_model": "H100", "gpus": 2, "vram_per_gpu_gib": 80, "total_vram_gib": 160, "provider": "MASSEDCOMPUTE", "price_per_hour": 7.15, "cost_efficiency": 22.38},
+    BrevInstance("H100", 2, 80, 160, "HYPERSTACK", 4.56, 35.09),
+    BrevInstance("H100", 2, 80, 160, "VOLTAGEPARK", 4.78, 33.47),
+    BrevInstance("H100", 2, 80, 160, "IMWT", 5.95, 26.89),
+    BrevInstance("H100", 2, 80, 160, "MASSEDCOMPUTE", 7.15, 22.38),
     
     # 4-GPU H100s
-    {"gpu_model": "H100", "gpus": 4, "vram_per_gpu_gib": 80, "total_vram_gib": 320, "provider": "HYPERSTACK", "price_per_hour": 9.12, "cost_efficiency": 35.09},
-    {"gpu_model": "H100", "gpus": 4, "vram_per_gpu_gib": 80, "total_vram_gib": 320, "provider": "VOLTAGEPARK", "price_per_hour": 9.55, "cost_efficiency": 33.51},
-    {"gpu_model": "H100", "gpus": 4, "vram_per_gpu_gib": 80, "total_vram_gib": 320, "provider": "IMWT", "price_per_hour": 11.90, "cost_efficiency": 26.89},
-    {"gpu_model": "H100", "gpus": 4, "vram_per_gpu_gib": 80, "total_vram_gib": 320, "provider": "MASSEDCOMPUTE", "price_per_hour": 14.30, "cost_efficiency": 22.38},
-    {"gpu_model": "H100", "gpus": 4, "vram_per_gpu_gib": 80, "total_vram_gib": 320, "provider": "LAMBDA-LABS", "price_per_hour": 14.83, "cost_efficiency": 21.58},
+    BrevInstance("H100", 4, 80, 320, "HYPERSTACK", 9.12, 35.09),
+    BrevInstance("H100", 4, 80, 320, "VOLTAGEPARK", 9.55, 33.51),
+    BrevInstance("H100", 4, 80, 320, "IMWT", 11.90, 26.89),
+    BrevInstance("H100", 4, 80, 320, "MASSEDCOMPUTE", 14.30, 22.38),
+    BrevInstance("H100", 4, 80, 320, "LAMBDA-LABS", 14.83, 21.58),
     
     # 8-GPU H100s
-    {"gpu_model": "H100", "gpus": 8, "vram_per_gpu_gib": 80, "total_vram_gib": 640, "provider": "HYPERSTACK", "price_per_hour": 18.24, "cost_efficiency": 35.09},
-    {"gpu_model": "H100", "gpus": 8, "vram_per_gpu_gib": 80, "total_vram_gib": 640, "provider": "VOLTAGEPARK", "price_per_hour": 19.10, "cost_efficiency": 33.51},
-    {"gpu_model": "H100", "gpus": 8, "vram_per_gpu_gib": 80, "total_vram_gib": 640, "provider": "LAMBDA-LABS", "price_per_hour": 28.70, "cost_efficiency": 22.30},
-    {"gpu_model": "H100", "gpus": 8, "vram_per_gpu_gib": 80, "total_vram_gib": 640, "provider": "DIGITALOCEAN", "price_per_hour": 28.70, "cost_efficiency": 22.30},
+    BrevInstance("H100", 8, 80, 640, "HYPERSTACK", 18.24, 35.09),
+    BrevInstance("H100", 8, 80, 640, "VOLTAGEPARK", 19.10, 33.51),
+    BrevInstance("H100", 8, 80, 640, "LAMBDA-LABS", 28.70, 22.30),
+    BrevInstance("H100", 8, 80, 640, "DIGITALOCEAN", 28.70, 22.30),
     
     # ============ A100 (Top 25 most cost-effective) ============
     # A100 80GB variants
-    {"gpu_model": "A100", "gpus": 1, "vram_per_gpu_gib": 80, "total_vram_gib": 80, "provider": "MASSEDCOMPUTE", "price_per_hour": 1.44, "cost_efficiency": 55.56},
-    {"gpu_model": "A100", "gpus": 1, "vram_per_gpu_gib": 80, "total_vram_gib": 80, "provider": "JARVIS-LABS", "price_per_hour": 1.49, "cost_efficiency": 53.69},
-    {"gpu_model": "A100", "gpus": 1, "vram_per_gpu_gib": 80, "total_vram_gib": 80, "provider": "LAMBDA-LABS", "price_per_hour": 1.65, "cost_efficiency": 48.48},
-    {"gpu_model": "A100", "gpus": 1, "vram_per_gpu_gib": 80, "total_vram_gib": 80, "provider": "DATACRUNCH", "price_per_hour": 1.79, "cost_efficiency": 44.69},
-    {"gpu_model": "A100", "gpus": 1, "vram_per_gpu_gib": 80, "total_vram_gib": 80, "provider": "VOLTAGEPARK", "price_per_hour": 1.99, "cost_efficiency": 40.20},
+    BrevInstance("A100", 1, 80, 80, "MASSEDCOMPUTE", 1.44, 55.56),
+    BrevInstance("A100", 1, 80, 80, "JARVIS-LABS", 1.49, 53.69),
+    BrevInstance("A100", 1, 80, 80, "LAMBDA-LABS", 1.65, 48.48),
+    BrevInstance("A100", 1, 80, 80, "DATACRUNCH", 1.79, 44.69),
+    BrevInstance("A100", 1, 80, 80, "VOLTAGEPARK", 1.99, 40.20),
     
     # A100 40GB variants (more cost-effective for smaller workloads)
-    {"gpu_model": "A100", "gpus": 1, "vram_per_gpu_gib": 40, "total_vram_gib": 40, "provider": "DENVI", "price_per_hour": 1.50, "cost_efficiency": 26.67},
-    {"gpu_model": "A100", "gpus": 1, "vram_per_gpu_gib": 40, "total_vram_gib": 40, "provider": "LAMBDA-LABS", "price_per_hour": 1.55, "cost_efficiency": 25.81},
-    {"gpu_model": "A100", "gpus": 1, "vram_per_gpu_gib": 40, "total_vram_gib": 40, "provider": "AWS", "price_per_hour": 1.77, "cost_efficiency": 22.60},
-    {"gpu_model": "A100", "gpus": 1, "vram_per_gpu_gib": 40, "total_vram_gib": 40, "provider": "DATACRUNCH", "price_per_hour": 1.89, "cost_efficiency": 21.16},
+    BrevInstance("A100", 1, 40, 40, "DENVI", 1.50, 26.67),
+    BrevInstance("A100", 1, 40, 40, "LAMBDA-LABS", 1.55, 25.81),
+    BrevInstance("A100", 1, 40, 40, "AWS", 1.77, 22.60),
+    BrevInstance("A100", 1, 40, 40, "DATACRUNCH", 1.89, 21.16),
     
     # Multi-GPU A100 configs
-    {"gpu_model": "A100", "gpus": 2, "vram_per_gpu_gib": 80, "total_vram_gib": 160, "provider": "MASSEDCOMPUTE", "price_per_hour": 2.87, "cost_efficiency": 55.75},
-    {"gpu_model": "A100", "gpus": 2, "vram_per_gpu_gib": 80, "total_vram_gib": 160, "provider": "JARVIS-LABS", "price_per_hour": 2.99, "cost_efficiency": 53.51},
-    {"gpu_model": "A100", "gpus": 4, "vram_per_gpu_gib": 80, "total_vram_gib": 320, "provider": "MASSEDCOMPUTE", "price_per_hour": 5.75, "cost_efficiency": 55.65},
-    {"gpu_model": "A100", "gpus": 8, "vram_per_gpu_gib": 80, "total_vram_gib": 640, "provider": "MASSEDCOMPUTE", "price_per_hour": 11.50, "cost_efficiency": 55.65},
+    BrevInstance("A100", 2, 80, 160, "MASSEDCOMPUTE", 2.87, 55.75),
+    BrevInstance("A100", 2, 80, 160, "JARVIS-LABS", 2.99, 53.51),
+    BrevInstance("A100", 4, 80, 320, "MASSEDCOMPUTE", 5.75, 55.65),
+    BrevInstance("A100", 8, 80, 640, "MASSEDCOMPUTE", 11.50, 55.65),
     
     # ============ L40S (15 instances) ============
-    {"gpu_model": "L40S", "gpus": 1, "vram_per_gpu_gib": 48, "total_vram_gib": 48, "provider": "MASSEDCOMPUTE", "price_per_hour": 1.19, "cost_efficiency": 40.34},
-    {"gpu_model": "L40S", "gpus": 1, "vram_per_gpu_gib": 48, "total_vram_gib": 48, "provider": "DATACRUNCH", "price_per_hour": 1.29, "cost_efficiency": 37.21},
-    {"gpu_model": "L40S", "gpus": 1, "vram_per_gpu_gib": 48, "total_vram_gib": 48, "provider": "LAMBDA-LABS", "price_per_hour": 1.50, "cost_efficiency": 32.00},
-    {"gpu_model": "L40S", "gpus": 2, "vram_per_gpu_gib": 48, "total_vram_gib": 96, "provider": "MASSEDCOMPUTE", "price_per_hour": 2.39, "cost_efficiency": 40.17},
-    {"gpu_model": "L40S", "gpus": 4, "vram_per_gpu_gib": 48, "total_vram_gib": 192, "provider": "MASSEDCOMPUTE", "price_per_hour": 4.77, "cost_efficiency": 40.25},
-    {"gpu_model": "L40S", "gpus": 8, "vram_per_gpu_gib": 48, "total_vram_gib": 384, "provider": "MASSEDCOMPUTE", "price_per_hour": 9.54, "cost_efficiency": 40.25},
+    BrevInstance("L40S", 1, 48, 48, "MASSEDCOMPUTE", 1.19, 40.34),
+    BrevInstance("L40S", 1, 48, 48, "DATACRUNCH", 1.29, 37.21),
+    BrevInstance("L40S", 1, 48, 48, "LAMBDA-LABS", 1.50, 32.00),
+    BrevInstance("L40S", 2, 48, 96, "MASSEDCOMPUTE", 2.39, 40.17),
+    BrevInstance("L40S", 4, 48, 192, "MASSEDCOMPUTE", 4.77, 40.25),
+    BrevInstance("L40S", 8, 48, 384, "MASSEDCOMPUTE", 9.54, 40.25),
     
     # ============ A10 (Verified prices) ============
-    {"gpu_model": "A10", "gpus": 1, "vram_per_gpu_gib": 24, "total_vram_gib": 24, "provider": "LAMBDA-LABS", "price_per_hour": 0.90, "cost_efficiency": 26.67},
-    {"gpu_model": "A10", "gpus": 1, "vram_per_gpu_gib": 24, "total_vram_gib": 24, "provider": "MASSEDCOMPUTE", "price_per_hour": 0.65, "cost_efficiency": 36.92},
-    {"gpu_model": "A10", "gpus": 1, "vram_per_gpu_gib": 24, "total_vram_gib": 24, "provider": "AWS", "price_per_hour": 0.77, "cost_efficiency": 31.17},
-    {"gpu_model": "A10", "gpus": 2, "vram_per_gpu_gib": 24, "total_vram_gib": 48, "provider": "MASSEDCOMPUTE", "price_per_hour": 1.29, "cost_efficiency": 37.21},
-    {"gpu_model": "A10", "gpus": 4, "vram_per_gpu_gib": 24, "total_vram_gib": 96, "provider": "MASSEDCOMPUTE", "price_per_hour": 2.59, "cost_efficiency": 37.07},
-    {"gpu_model": "A10", "gpus": 8, "vram_per_gpu_gib": 24, "total_vram_gib": 192, "provider": "MASSEDCOMPUTE", "price_per_hour": 5.18, "cost_efficiency": 37.07},
+    BrevInstance("A10", 1, 24, 24, "LAMBDA-LABS", 0.90, 26.67),
+    BrevInstance("A10", 1, 24, 24, "MASSEDCOMPUTE", 0.65, 36.92),
+    BrevInstance("A10", 1, 24, 24, "AWS", 0.77, 31.17),
+    BrevInstance("A10", 2, 24, 48, "MASSEDCOMPUTE", 1.29, 37.21),
+    BrevInstance("A10", 4, 24, 96, "MASSEDCOMPUTE", 2.59, 37.07),
+    BrevInstance("A10", 8, 24, 192, "MASSEDCOMPUTE", 5.18, 37.07),
     
     # ============ RTX 4090 (10 instances) ============
-    {"gpu_model": "RTX 4090", "gpus": 1, "vram_per_gpu_gib": 24, "total_vram_gib": 24, "provider": "MASSEDCOMPUTE", "price_per_hour": 0.59, "cost_efficiency": 40.68},
-    {"gpu_model": "RTX 4090", "gpus": 1, "vram_per_gpu_gib": 24, "total_vram_gib": 24, "provider": "JARVIS-LABS", "price_per_hour": 0.69, "cost_efficiency": 34.78},
-    {"gpu_model": "RTX 4090", "gpus": 2, "vram_per_gpu_gib": 24, "total_vram_gib": 48, "provider": "MASSEDCOMPUTE", "price_per_hour": 1.19, "cost_efficiency": 40.34},
-    {"gpu_model": "RTX 4090", "gpus": 4, "vram_per_gpu_gib": 24, "total_vram_gib": 96, "provider": "MASSEDCOMPUTE", "price_per_hour": 2.38, "cost_efficiency": 40.34},
-    {"gpu_model": "RTX 4090", "gpus": 8, "vram_per_gpu_gib": 24, "total_vram_gib": 192, "provider": "MASSEDCOMPUTE", "price_per_hour": 4.76, "cost_efficiency": 40.34},
+    BrevInstance("RTX 4090", 1, 24, 24, "MASSEDCOMPUTE", 0.59, 40.68),
+    BrevInstance("RTX 4090", 1, 24, 24, "JARVIS-LABS", 0.69, 34.78),
+    BrevInstance("RTX 4090", 2, 24, 48, "MASSEDCOMPUTE", 1.19, 40.34),
+    BrevInstance("RTX 4090", 4, 24, 96, "MASSEDCOMPUTE", 2.38, 40.34),
+    BrevInstance("RTX 4090", 8, 24, 192, "MASSEDCOMPUTE", 4.76, 40.34),
     
     # ============ RTX A6000 (8 instances) ============
-    {"gpu_model": "RTX A6000", "gpus": 1, "vram_per_gpu_gib": 48, "total_vram_gib": 48, "provider": "MASSEDCOMPUTE", "price_per_hour": 0.89, "cost_efficiency": 53.93},
-    {"gpu_model": "RTX A6000", "gpus": 1, "vram_per_gpu_gib": 48, "total_vram_gib": 48, "provider": "AWS", "price_per_hour": 1.39, "cost_efficiency": 34.53},
-    {"gpu_model": "RTX A6000", "gpus": 2, "vram_per_gpu_gib": 48, "total_vram_gib": 96, "provider": "MASSEDCOMPUTE", "price_per_hour": 1.79, "cost_efficiency": 53.63},
-    {"gpu_model": "RTX A6000", "gpus": 4, "vram_per_gpu_gib": 48, "total_vram_gib": 192, "provider": "MASSEDCOMPUTE", "price_per_hour": 3.58, "cost_efficiency": 53.63},
+    BrevInstance("RTX A6000", 1, 48, 48, "MASSEDCOMPUTE", 0.89, 53.93),
+    BrevInstance("RTX A6000", 1, 48, 48, "AWS", 1.39, 34.53),
+    BrevInstance("RTX A6000", 2, 48, 96, "MASSEDCOMPUTE", 1.79, 53.63),
+    BrevInstance("RTX A6000", 4, 48, 192, "MASSEDCOMPUTE", 3.58, 53.63),
     
     # ============ A30 (Cheapest option!) ============
-    {"gpu_model": "A30", "gpus": 1, "vram_per_gpu_gib": 24, "total_vram_gib": 24, "provider": "MASSEDCOMPUTE", "price_per_hour": 0.40, "cost_efficiency": 60.00},
+    BrevInstance("A30", 1, 24, 24, "MASSEDCOMPUTE", 0.40, 60.00),
     
     # ============ A4000 (Very cost-effective) ============
-    {"gpu_model": "A4000", "gpus": 1, "vram_per_gpu_gib": 16, "total_vram_gib": 16, "provider": "HYPERSTACK", "price_per_hour": 0.36, "cost_efficiency": 44.44},
-    {"gpu_model": "A4000", "gpus": 2, "vram_per_gpu_gib": 16, "total_vram_gib": 32, "provider": "HYPERSTACK", "price_per_hour": 0.72, "cost_efficiency": 44.44},
+    BrevInstance("A4000", 1, 16, 16, "HYPERSTACK", 0.36, 44.44),
+    BrevInstance("A4000", 2, 16, 32, "HYPERSTACK", 0.72, 44.44),
     
     # ============ T4 (Entry tier) ============
-    {"gpu_model": "T4", "gpus": 1, "vram_per_gpu_gib": 16, "total_vram_gib": 16, "provider": "GCP", "price_per_hour": 0.49, "cost_efficiency": 32.65},
+    BrevInstance("T4", 1, 16, 16, "GCP", 0.49, 32.65),
     
     # ============ P4 (Small VRAM) ============
-    {"gpu_model": "P4", "gpus": 1, "vram_per_gpu_gib": 8, "total_vram_gib": 8, "provider": "GCP", "price_per_hour": 0.78, "cost_efficiency": 10.26},
+    BrevInstance("P4", 1, 8, 8, "GCP", 0.78, 10.26),
     
     # ============ M60 (Legacy, small VRAM) ============
-    {"gpu_model": "M60", "gpus": 1, "vram_per_gpu_gib": 8, "total_vram_gib": 8, "provider": "AWS", "price_per_hour": 0.90, "cost_efficiency": 8.89},
+    BrevInstance("M60", 1, 8, 8, "AWS", 0.90, 8.89),
     
     # ============ V100 (Legacy but still available) ============
-    {"gpu_model": "V100", "gpus": 1, "vram_per_gpu_gib": 16, "total_vram_gib": 16, "provider": "MASSEDCOMPUTE", "price_per_hour": 0.89, "cost_efficiency": 17.98},
-    {"gpu_model": "V100", "gpus": 1, "vram_per_gpu_gib": 32, "total_vram_gib": 32, "provider": "AWS", "price_per_hour": 1.50, "cost_efficiency": 21.33},
-    {"gpu_model": "V100", "gpus": 2, "vram_per_gpu_gib": 16, "total_vram_gib": 32, "provider": "MASSEDCOMPUTE", "price_per_hour": 1.79, "cost_efficiency": 17.88},
+    BrevInstance("V100", 1, 16, 16, "MASSEDCOMPUTE", 0.89, 17.98),
+    BrevInstance("V100", 1, 32, 32, "AWS", 1.50, 21.33),
+    BrevInstance("V100", 2, 16, 32, "MASSEDCOMPUTE", 1.79, 17.88),
 ]
 
 
+# Cheapest first, then most VRAM per dollar; sorted once instead of per call.
+# The sort is stable, so filtering this view gives the same order as sorting
+# the filtered list.
+_INSTANCES_BY_PRICE: List[BrevInstance] = sorted(
+    BREV_INSTANCES, key=lambda x: (x.price_per_hour, -x.cost_efficiency)
+)
+# Parallel column of total VRAM so the fit check skips the attribute lookup
+_VRAM_BY_PRICE: tuple[float, ...] = tuple(i.total_vram_gib for i in _INSTANCES_BY_PRICE)
+# Running max of that column; the first index reaching a threshold is the
+# cheapest fit, so finding the recommendation is a bisect
+_VRAM_PREFIX_MAX: tuple[float, ...] = tuple(accumulate(_VRAM_BY_PRICE, max))
+# All VRAM sizes ascending; counting fits is a bisect instead of a full scan
+_VRAM_ASCENDING: tuple[float, ...] = tuple(sorted(_VRAM_BY_PRICE))
+
+
+def _index_configs() -> tuple[tuple[int, ...], Dict[int, int]]:
+    """Index the cheapest and second-cheapest instance of each config.
+
+    A config is (gpu_model, gpus, vram_per_gpu_gib); providers offering the
+    same config are duplicates for the alternatives list.
+
+    Returns:
+        Price-ordered indices into _INSTANCES_BY_PRICE of each config's
+        cheapest instance, and a map from those indices to the config's
+        second-cheapest instance.
+    """
+    cheapest: Dict[tuple, int] = {}
+    runner_up: Dict[int, int] = {}
+    for i, instance in enumerate(_INSTANCES_BY_PRICE):
+        key = (instance.gpu_model, instance.gpus, instance.vram_per_gpu_gib)
+        leader = cheapest.setdefault(key, i)
+        if leader != i:
+            runner_up.setdefault(leader, i)
+    return tuple(cheapest.values()), runner_up
+
+
+_CONFIG_LEADERS, _CONFIG_RUNNER_UP = _index_configs()
+
+
+@functools.lru_cache(maxsize=256)
+def _fitting_instances(
+    required_vram: float, max_results: int
+) -> tuple[Optional[BrevInstance], tuple[BrevInstance, ...], int]:
+    """Find the cheapest fit, distinct alternatives, and fit count (memoized)."""
+    # Get top recommendation
+    first_fit = bisect_left(_VRAM_PREFIX_MAX, required_vram)
+    if first_fit == len(_VRAM_PREFIX_MAX):
+        return None, (), 0
+    
+    # Get alternatives (next cheapest options, different providers/configs).
+    # The recommendation leads its own config, so that config's next
+    # provider is merged in alongside the other configs that fit.
+    other_configs = (
+        i
+        for i in islice(_CONFIG_LEADERS, bisect_right(_CONFIG_LEADERS, first_fit), None)
+        if _VRAM_BY_PRICE[i] >= required_vram
+    )
+    same_config = _CONFIG_RUNNER_UP.get(first_fit)
+    if same_config is not None:
+        other_configs = heapq.merge(other_configs, (same_config,))
+    alternatives = tuple(
+        _INSTANCES_BY_PRICE[i] for i in islice(other_configs, max(max_results, 0))
+    )
+    
+    total_options = len(_VRAM_ASCENDING) - bisect_left(_VRAM_ASCENDING, required_vram)
+    return _INSTANCES_BY_PRICE[first_fit], alternatives, total_options
+
+
 def recommend_gpu_advanced(
     estimated_vram_gb: float,
     current_gpu: Optional[str] = None,
@@ -174,64 +246,36 @@ def recommend_gpu_advanced(
     # Add 20% buffer for safety
     required_vram = estimated_vram_gb * 1.2
     
-    # Find instances that fit
-    suitable_instances = []
-    for instance in BREV_INSTANCES:
-        if instance["total_vram_gib"] >= required_vram:
-            suitable_instances.append(instance)
-    
-    if not suitable_instances:
+    recommended, alternatives, total_options = _fitting_instances(required_vram, max_results)
+    if recommended is None:
         return {
             "recommended": None,
             "reason": "No GPU configuration large enough for requirements",
             "alternatives": [],
         }
     
-    # Sort by price (cheapest first), then by cost efficiency
-    suitable_instances.sort(key=lambda x: (x["price_per_hour"], -x["cost_efficiency"]))
-    
-    # Get top recommendation
-    recommended = suitable_instances[0]
-    
     # Calculate savings if current price provided
     savings = None
     if current_price:
-        savings_per_hour = current_price - recommended["price_per_hour"]
+        savings_per_hour = current_price - recommended.price_per_hour
         savings = {
             "hourly": savings_per_hour,
             "monthly": calculate_monthly_cost(savings_per_hour),
             "yearly": calculate_yearly_cost(savings_per_hour),
         }
     
-    # Get alternatives (next cheapest options, different providers/configs)
-    alternatives = []
-    seen_configs = set()
-    
-    for instance in suitable_instances[1:]:
-        config_key = (instance["gpu_model"], instance["gpus"], instance["vram_per_gpu_gib"])
-        
-        # Skip if we've seen this exact config already (different provider)
-        if config_key in seen_configs:
-            continue
-        
-        seen_configs.add(config_key)
-        alternatives.append(instance)
-        
-        if len(alternatives) >= max_results:
-            break
-    
     return {
         "recommended": recommended,
         "savings": savings,
-        "alternatives": alternatives,
-        "total_options": len(suitable_instances),
+        "alternatives": list(alternatives),
+        "total_options": total_options,
     }
 
 
 def format_instance_name(instance: BrevInstance) -> str:
     """Format instance name for display."""
-    if instance["gpus"] == 1:
-        return f"{instance['gpu_model']} ({instance['provider']})"
+    if instance.gpus == 1:
+        return f"{instance.gpu_model} ({instance.provider})"
     else:
-        return f"{instance['gpus']}x {instance['gpu_model']} ({instance['provider']})"
+        return f"{instance.gpus}x {instance.gpu_model} ({instance.provider})"
 
@@ -1,7 +1,10 @@
 """Project scanning and metadata collection."""
 
+import shutil
 import subprocess
-from dataclasses import dataclass, field
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Optional
 
@@ -46,33 +49,24 @@ class ProjectScan:
     brev: BrevInfo = field(default_factory=BrevInfo)
 
 
-def check_brev_cli() -> BrevInfo:
-    """Check if Brev CLI is available and get instance info.
-    
-    Also detects GPU from nvidia-smi even if Brev CLI is not available.
-    """
-    info = BrevInfo()
-    
-    # Always try to detect GPU from nvidia-smi
-    info.gpu_type = detect_current_gpu()
-    info.gpu_memory_gb = get_gpu_memory_gb()
+# Seconds a check_brev_cli result is reused before brev is queried again
+_BREV_CACHE_TTL = 30.0
+_BREV_CACHE: Optional[tuple[float, BrevInfo]] = None
 
-    try:
-        # Check if brev command exists
-        result = subprocess.run(
-            ["which", "brev"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode != 0:
-            return info
+# Tokens in `brev ls` rows that are markers or statuses, not instance names
+_BREV_LS_SKIP = frozenset({"*", "RUNNING", "STOPPED", "CREATING"})
 
-        info.available = True
 
-        # Try to get instance name from brev ls
+def _detect_gpu() -> tuple[str, Optional[float]]:
+    """Detect GPU type and memory (both read the same nvidia-smi query)."""
+    return detect_current_gpu(), get_gpu_memory_gb()
+
+
+def _read_brev_instance(brev_path: str, info: BrevInfo) -> None:
+    """Fill instance name and status from `brev ls` output (best-effort)."""
+    try:
         result = subprocess.run(
-            ["brev", "ls"],
+            [brev_path, "ls"],
             capture_output=True,
             text=True,
             timeout=10,
@@ -80,33 +74,66 @@ def check_brev_cli() -> BrevInfo:
         if result.returncode == 0:
             # Parse output to find current instance
             # This is best-effort; format may vary
-            lines = result.stdout.strip().split("\n")
-            for line in lines:
-                if "*" in line or "RUNNING" in line.upper():
+            for line in result.stdout.splitlines():
+                running = "RUNNING" in line.upper()
+                if running or "*" in line:
                     # Try to extract instance name
                     parts = line.split()
                     if len(parts) >= 2:
                         # Skip markers like * and status indicators
-                        for part in parts:
-                            if part not in ("*", "RUNNING", "STOPPED", "CREATING"):
-                                info.instance_name = part
-                                break
+                        name = next((part for part in parts if part not in _BREV_LS_SKIP), None)
+                        if name is not None:
+                            info.instance_name = name
                         # Try to extract status
-                        if "RUNNING" in line.upper():
+                        if running:
                             info.status = "RUNNING"
                         break
 
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
         pass
 
+
+def check_brev_cli(force: bool = False) -> BrevInfo:
+    """Check if Brev CLI is available and get instance info.
+    
+    Also detects GPU from nvidia-smi even if Brev CLI is not available.
+    The GPU query runs in a worker thread while `brev ls` runs, so the
+    two subprocess waits overlap instead of adding up. Results are reused
+    for _BREV_CACHE_TTL seconds.
+
+    Args:
+        force: Query again even if a cached result is still fresh.
+    """
+    global _BREV_CACHE
+
+    if not force and _BREV_CACHE is not None:
+        checked_at, cached = _BREV_CACHE
+        if time.monotonic() - checked_at < _BREV_CACHE_TTL:
+            return replace(cached)
+
+    info = BrevInfo()
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        # Always try to detect GPU from nvidia-smi
+        gpu_future = pool.submit(_detect_gpu)
+
+        # Check if brev command exists
+        brev_path = shutil.which("brev")
+        if brev_path is not None:
+            info.available = True
+            _read_brev_instance(brev_path, info)
+
+        info.gpu_type, info.gpu_memory_gb = gpu_future.result()
+
+    _BREV_CACHE = (time.monotonic(), replace(info))
     return info
 
 
-def scan_project(path: Path = Path.cwd()) -> ProjectScan:
+def scan_project(path: Optional[Path] = None) -> ProjectScan:
     """Scan the project directory and collect all metadata.
 
     Args:
-        path: Project directory path.
+        path: Project directory path (default: current directory).
 
     Returns:
         ProjectScan with all collected information.
@@ -114,6 +141,9 @@ def scan_project(path: Path = Path.cwd()) -> ProjectScan:
     Raises:
         GitError: If not a git repo or origin is missing.
     """
+    if path is None:
+        path = Path.cwd()
+
     git_info = get_git_info(path)
 
     dependency_file = detect_dependency_file(path)
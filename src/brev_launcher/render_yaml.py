@@ -1,118 +1,249 @@
 """YAML rendering with stable ordering."""
 
+import functools
+import json
+import re
+import threading
 from io import StringIO
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, TextIO
 
-from ruamel.yaml import YAML
+from pydantic import BaseModel
 
 from .constants import LAUNCHABLE_YAML
 from .launchable_schema import LaunchableConfig
 
+if TYPE_CHECKING:
+    from ruamel.yaml import YAML
+
+# ruamel.yaml folds scalars past this column
+_LINE_WIDTH = 80
+
+# Strings ruamel.yaml emits unquoted: no indicator, float or "..." document
+# marker at the start, no ": " or " #", single spaces only, ASCII only
+_PLAIN_RE = re.compile(
+    r"(?:[A-Za-z_/]|\.(?![0-9_]|\.\.))[\w./=@+:()-]*(?: [\w./=@+:()-]+)*", re.ASCII
+)
+# Plain-looking strings that would load as booleans, nulls or special floats
+_RESERVED_WORDS = frozenset(
+    {"true", "false", "null", "yes", "no", "on", "off", "y", "n", ".inf", ".nan"}
+)
+# Strings ruamel.yaml single-quotes because they would load as a number or
+# timestamp (python_version "3.10", generated_at)
+_QUOTED_RE = re.compile(
+    r"[0-9]+(?:\.[0-9]*)?"
+    r"|[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}(?:\.[0-9]+)?(?:Z|[+-][0-9]{2}:[0-9]{2})?"
+)
+
+_YAML_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _yaml() -> "YAML":
+    """Build the ruamel YAML instance on first use.
+
+    Configured once; building a YAML() wires up its emitter and representer.
+    Dumps share the instance's state, so they are serialized by the lock.
+    """
+    from ruamel.yaml import YAML
+
+    yaml = YAML()
+    yaml.default_flow_style = False
+    yaml.indent(mapping=2, sequence=4, offset=2)
+    yaml.preserve_quotes = True
+    return yaml
 
-def _ordered_dict_from_config(config: LaunchableConfig) -> dict[str, Any]:
-    """Convert LaunchableConfig to an ordered dict for YAML output.
 
-    Ensures stable key ordering for reproducible output.
+def _fields(model: BaseModel) -> Iterator[tuple[str, Any]]:
+    """Yield a model's fields in declaration order, skipping unset ones.
+
+    Pydantic keeps field values in the instance __dict__ in declaration
+    order, which is the output order, so YAML keys stay stable. Optional
+    sections (only the active start mode) are None when unset.
     """
-    result: dict[str, Any] = {}
-
-    # Top-level fields in desired order
-    result["name"] = config.name
-    result["description"] = config.description
-
-    # Source section
-    result["source"] = {
-        "type": config.source.type,
-        "url": config.source.url,
-        "ref": config.source.ref,
-        "path": config.source.path,
-    }
+    return ((key, value) for key, value in model.__dict__.items() if value is not None)
 
-    # Runtime section
-    runtime: dict[str, Any] = {
-        "mode": config.runtime.mode,
-        "setup": {
-            "python_version": config.runtime.setup.python_version,
-            "install": config.runtime.setup.install,
-        },
-    }
 
-    # Start config - only include the active mode
-    start: dict[str, Any] = {}
-    if config.runtime.start.notebook:
-        nb = config.runtime.start.notebook
-        start["notebook"] = {
-            "enable_jupyter": nb.enable_jupyter,
-            "command": nb.command,
-            "port": nb.port,
-        }
-    if config.runtime.start.webapp:
-        wa = config.runtime.start.webapp
-        start["webapp"] = {
-            "expose_port": wa.expose_port,
-            "command": wa.command,
-        }
-    runtime["start"] = start
-    result["runtime"] = runtime
-
-    # Compute section
-    result["compute"] = {
-        "gpu": config.compute.gpu,
-        "note": config.compute.note,
+def _model_data(model: BaseModel) -> dict[str, Any]:
+    """Convert a config model to nested dicts for ruamel.yaml."""
+    return {
+        key: _model_data(value) if isinstance(value, BaseModel) else value
+        for key, value in _fields(model)
     }
 
-    # Networking section
-    result["networking"] = {
-        "ports": config.networking.ports,
-    }
 
-    # Files section
-    result["files"] = {
-        "include": config.files.include,
-    }
+@functools.lru_cache(maxsize=128)
+def _render_data(data_json: str) -> str:
+    """Emit YAML for JSON-encoded ordered config data (memoized)."""
+    stream = StringIO()
+    with _YAML_LOCK:
+        _yaml().dump(json.loads(data_json), stream)
+    return stream.getvalue()
 
-    # Metadata section
-    result["metadata"] = {
-        "generated_by": config.metadata.generated_by,
-        "generated_at": config.metadata.generated_at,
-    }
 
-    return result
+def _scalar(value: Any) -> Optional[str]:
+    """Format a scalar the way ruamel.yaml would, or None if unsure."""
+    if isinstance(value, str):
+        if _PLAIN_RE.fullmatch(value):
+            if value.endswith(":") or ": " in value or value.lower() in _RESERVED_WORDS:
+                return None
+            return value
+        if _QUOTED_RE.fullmatch(value):
+            return f"'{value}'"
+        return None
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    return None
+
+
+def _emit_model(model: BaseModel, indent: int, lines: list[str]) -> bool:
+    """Append block-style YAML lines for a config model.
+
+    Returns:
+        False if some value needs ruamel.yaml to get the quoting or line
+        folding exactly right; lines is then incomplete.
+    """
+    pad = " " * indent
+    # Same walk as _fields, inlined; scalars are tested first as the most common
+    for key, value in model.__dict__.items():
+        if value is None:
+            continue
+        if isinstance(value, (str, int)):
+            text = _scalar(value)
+            if text is None or indent + len(key) + 2 + len(text) > _LINE_WIDTH:
+                return False
+            lines.append(f"{pad}{key}: {text}")
+        elif isinstance(value, list):
+            if not value:
+                lines.append(f"{pad}{key}: []")
+                continue
+            lines.append(f"{pad}{key}:")
+            for item in value:
+                text = _scalar(item)
+                if text is None or indent + 4 + len(text) > _LINE_WIDTH:
+                    return False
+                lines.append(f"{pad}  - {text}")
+        elif isinstance(value, BaseModel):
+            header = len(lines)
+            lines.append(f"{pad}{key}:")
+            if not _emit_model(value, indent + 2, lines):
+                return False
+            if len(lines) == header + 1:
+                lines[header] = f"{pad}{key}: {{}}"
+        else:
+            return False
+    return True
 
 
 def render_yaml(config: LaunchableConfig) -> str:
     """Render LaunchableConfig to YAML string.
 
-    Uses ruamel.yaml for stable output with:
+    Produces ruamel.yaml's output with:
     - 2-space indentation
     - Preserved key ordering
     - Human-readable format
-    """
-    yaml = YAML()
-    yaml.default_flow_style = False
-    yaml.indent(mapping=2, sequence=4, offset=2)
-    yaml.preserve_quotes = True
 
-    ordered_data = _ordered_dict_from_config(config)
+    The schema's shape is fixed, so the common case is written directly
+    line by line. Any scalar whose quoting or folding is not certain sends
+    the whole document through ruamel.yaml instead, which is only imported
+    when that happens.
+
+    The libyaml-backed C emitter is deliberately not used: it ignores the
+    sequence offset and would emit ``ports:`` items unindented, changing
+    every generated file.
+
+    ruamel.yaml output is memoized on the config's content. JSON keeps key
+    order and round-trips the str/int/bool/None values the schema holds,
+    so it serves as both the cache key and the data to emit.
+    """
+    lines: list[str] = []
+    if _emit_model(config, 0, lines):
+        return "\n".join(lines) + "\n"
+    return _render_data(json.dumps(_model_data(config)))
 
-    stream = StringIO()
-    yaml.dump(ordered_data, stream)
-    return stream.getvalue()
 
+def as_canonical_bytes(config: LaunchableConfig) -> bytes:
+    """Serialize config compactly for equality checks, without YAML.
 
-def write_launchable_yaml(config: LaunchableConfig, path: Path = Path.cwd()) -> Path:
+    Field order is fixed and generated_at is left out, so two configs
+    describing the same launchable give the same bytes.
+    """
+    data = _model_data(config)
+    del data["metadata"]["generated_at"]
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _dump_to_stream(config: LaunchableConfig, stream: TextIO) -> None:
+    """Write config as YAML to stream without building the whole text first."""
+    lines: list[str] = []
+    if _emit_model(config, 0, lines):
+        stream.writelines(f"{line}\n" for line in lines)
+        return
+    with _YAML_LOCK:
+        _yaml().dump(_model_data(config), stream)
+
+
+def write_launchable_yaml(
+    config: LaunchableConfig,
+    path: Optional[Path] = None,
+    yaml_content: Optional[str] = None,
+) -> Path:
     """Write LaunchableConfig to launchable.yaml file.
 
     Args:
         config: The configuration to write.
-        path: Directory to write the file in.
+        path: Directory to write the file in (default: current directory).
+        yaml_content: Output of render_yaml(config), if the caller already
+            has it. Otherwise the YAML is streamed straight to the file.
 
     Returns:
         Path to the written file.
     """
-    yaml_content = render_yaml(config)
+    if path is None:
+        path = Path.cwd()
     output_path = path / LAUNCHABLE_YAML
-    output_path.write_text(yaml_content)
+    if yaml_content is not None:
+        # Already rendered: one encode and one write, no text-layer buffering
+        output_path.write_bytes(yaml_content.encode("utf-8"))
+        return output_path
+    # newline="\n" keeps LF endings on every platform, matching write_bytes
+    with output_path.open("w", encoding="utf-8", newline="\n") as f:
+        _dump_to_stream(config, f)
     return output_path
 
+
+def render_many(configs: Iterable[LaunchableConfig]) -> list[str]:
+    """Render several configs to YAML strings.
+
+    Args:
+        configs: Configurations to render.
+
+    Returns:
+        Rendered YAML, one string per config in input order.
+    """
+    return [render_yaml(config) for config in configs]
+
+
+def write_many(configs: Iterable[LaunchableConfig], paths: Iterable[Path]) -> list[Path]:
+    """Write several configs, each to launchable.yaml in its own directory.
+
+    Each file is streamed straight to disk as in write_launchable_yaml.
+
+    Args:
+        configs: Configurations to write.
+        paths: Directory for each config, in the same order.
+
+    Returns:
+        Paths to the written files.
+
+    Raises:
+        ValueError: If configs and paths differ in length.
+    """
+    configs = list(configs)
+    paths = list(paths)
+    # Check up front so a mismatch writes nothing
+    if len(configs) != len(paths):
+        raise ValueError(f"Got {len(configs)} configs but {len(paths)} paths")
+    return [write_launchable_yaml(config, path) for config, path in zip(configs, paths)]
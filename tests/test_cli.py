@@ -0,0 +1,31 @@
+"""Tests for cli module."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from brev_launcher.cli import app
+
+runner = CliRunner()
+
+
+class TestCostEstimate:
+    """Tests for the cost-estimate command."""
+
+    def test_no_gpu_shows_any_gpu(self, tmp_path: Path) -> None:
+        """Should price the current setup as "Any GPU" when no GPU is detected."""
+        with patch("brev_launcher.detect.detect_current_gpu", return_value="any"):
+            result = runner.invoke(app, ["cost-estimate", str(tmp_path)])
+
+        assert result.exit_code == 0, result.output
+        assert "GPU: Any GPU (16GB VRAM)" in result.output
+        assert "$0.60/hour" in result.output
+
+    def test_detected_gpu_is_current(self, tmp_path: Path) -> None:
+        """Should price the current setup as the detected GPU."""
+        with patch("brev_launcher.detect.detect_current_gpu", return_value="gpu_1x_a10"):
+            result = runner.invoke(app, ["cost-estimate", str(tmp_path)])
+
+        assert result.exit_code == 0, result.output
+        assert "GPU: A10 (24GB VRAM)" in result.output
@@ -1,17 +1,27 @@
 """Tests for detect module."""
 
+import sys
 import tempfile
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from brev_launcher.detect import (
+    _build_dir_index,
+    _query_nvidia_smi,
+    _scan_source_file,
+    detect_current_gpu,
     detect_dependency_file,
     detect_entry_file,
     detect_env_example,
+    detect_launchable_yaml,
     detect_notebooks_folder,
     detect_ports_in_code,
+    estimate_vram_usage,
+    estimate_vram_usage_detailed,
     find_candidate_entry_files,
+    get_gpu_memory_gb,
     get_install_command,
     infer_project_type,
 )
@@ -105,6 +115,20 @@ class TestFindCandidateEntryFiles:
         candidates = find_candidate_entry_files(tmp_path)
         assert "__init__.py" not in candidates
 
+    def test_sorted_across_types(self, tmp_path: Path) -> None:
+        """Should return notebooks and Python files in one sorted list."""
+        for name in ("b.py", "c.ipynb", "a.ipynb", "d.py"):
+            (tmp_path / name).write_text("")
+
+        assert find_candidate_entry_files(tmp_path) == ["a.ipynb", "b.py", "c.ipynb", "d.py"]
+
+    def test_limit(self, tmp_path: Path) -> None:
+        """Should return only the first N candidates."""
+        for name in ("b.py", "c.ipynb", "a.ipynb", "d.py"):
+            (tmp_path / name).write_text("")
+
+        assert find_candidate_entry_files(tmp_path, limit=3) == ["a.ipynb", "b.py", "c.ipynb"]
+
 
 class TestDetectEnvExample:
     """Tests for detect_env_example."""
@@ -119,6 +143,19 @@ class TestDetectEnvExample:
         assert detect_env_example(tmp_path) is False
 
 
+class TestDetectLaunchableYaml:
+    """Tests for detect_launchable_yaml."""
+
+    def test_launchable_yaml_exists(self, tmp_path: Path) -> None:
+        """Should return True when launchable.yaml exists."""
+        (tmp_path / "launchable.yaml").write_text("name: test\n")
+        assert detect_launchable_yaml(tmp_path) is True
+
+    def test_no_launchable_yaml(self, tmp_path: Path) -> None:
+        """Should return False when no launchable.yaml."""
+        assert detect_launchable_yaml(tmp_path) is False
+
+
 class TestDetectNotebooksFolder:
     """Tests for detect_notebooks_folder."""
 
@@ -137,6 +174,45 @@ class TestDetectNotebooksFolder:
         assert detect_notebooks_folder(tmp_path) is False
 
 
+class TestDirectoryIndex:
+    """Tests for the cached single-pass directory index."""
+
+    def test_repeated_calls_hit_cache(self, tmp_path: Path) -> None:
+        """Should list the directory once while nothing changes."""
+        (tmp_path / "app.py").write_text("# app")
+        _build_dir_index.cache_clear()
+        assert infer_project_type(tmp_path) == "webapp"
+        assert detect_entry_file(tmp_path, "webapp") == "app.py"
+        assert _build_dir_index.cache_info().misses == 1
+
+    def test_all_detectors_share_one_listing(self, tmp_path: Path) -> None:
+        """Should serve every per-path detector from a single listing."""
+        (tmp_path / "app.py").write_text("# app")
+        (tmp_path / "requirements.txt").write_text("gradio\n")
+        _build_dir_index.cache_clear()
+        project_type = infer_project_type(tmp_path)
+        detect_dependency_file(tmp_path)
+        detect_entry_file(tmp_path, project_type)
+        detect_env_example(tmp_path)
+        detect_launchable_yaml(tmp_path)
+        detect_notebooks_folder(tmp_path)
+        find_candidate_entry_files(tmp_path)
+        detect_dependency_file(tmp_path)
+        assert _build_dir_index.cache_info().misses == 1
+
+    def test_new_file_invalidates_cache(self, tmp_path: Path) -> None:
+        """Should pick up files added after the first call."""
+        assert detect_dependency_file(tmp_path) is None
+        (tmp_path / "requirements.txt").write_text("numpy\n")
+        assert detect_dependency_file(tmp_path) == "requirements.txt"
+
+    def test_missing_directory(self, tmp_path: Path) -> None:
+        """Should treat a missing directory as empty."""
+        missing = tmp_path / "missing"
+        assert detect_dependency_file(missing) is None
+        assert find_candidate_entry_files(missing) == []
+
+
 class TestDetectPortsInCode:
     """Tests for detect_ports_in_code."""
 
@@ -152,6 +228,31 @@ class TestDetectPortsInCode:
         ports = detect_ports_in_code(tmp_path)
         assert 5000 in ports
 
+    def test_detects_all_pattern_forms(self, tmp_path: Path) -> None:
+        """Should match port=, PORT=, --port and host:port forms."""
+        (tmp_path / "app.py").write_text(
+            'PORT = 8000\n'
+            'cmd = "streamlit run app.py --port 8501"\n'
+            'url = "http://localhost:3000"\n'
+        )
+        assert detect_ports_in_code(tmp_path) == [3000, 8000, 8501]
+
+    def test_only_scans_head_of_large_files(self, tmp_path: Path) -> None:
+        """Should not read past the scan cap in large files."""
+        padding = "# generated\n" * 30000
+        (tmp_path / "app.py").write_text(padding + "app.run(port=5000)\n")
+        assert detect_ports_in_code(tmp_path) == []
+
+    def test_ignores_common_ports_inside_longer_numbers(self, tmp_path: Path) -> None:
+        """Should not match a common port embedded in a longer number."""
+        (tmp_path / "app.py").write_text('port = 15000\nurl = "http://localhost:80801"\n')
+        assert detect_ports_in_code(tmp_path) == []
+
+    def test_ignores_bare_numbers(self, tmp_path: Path) -> None:
+        """Should require a port prefix before the number."""
+        (tmp_path / "app.py").write_text("batch_size = 8000\n")
+        assert detect_ports_in_code(tmp_path) == []
+
     def test_ignores_uncommon_ports(self, tmp_path: Path) -> None:
         """Should ignore uncommon ports."""
         (tmp_path / "app.py").write_text('port = 12345')
@@ -195,3 +296,198 @@ class TestInferProjectType:
         """Should default to notebook when no files."""
         assert infer_project_type(tmp_path) == "notebook"
 
+
+class TestEstimateVramUsage:
+    """Tests for estimate_vram_usage_detailed."""
+
+    def test_detects_model_and_framework(self, tmp_path: Path) -> None:
+        """Should detect the model, its VRAM and the framework in code."""
+        (tmp_path / "app.py").write_text(
+            'import torch\nMODEL_ID = "stabilityai/stable-diffusion-xl-base-1.0"\n'
+        )
+        details = estimate_vram_usage_detailed(tmp_path)
+        assert details is not None
+        assert details["base_vram"] == 12.0
+        assert details["estimated_vram"] == 18.0
+        assert [m["model"] for m in details["detected_models"]] == ["Stable Diffusion XL"]
+        assert details["frameworks"] == ["PyTorch"]
+
+    def test_detects_every_matching_model_and_framework(self, tmp_path: Path) -> None:
+        """Should report each matching model and framework, not just the first."""
+        (tmp_path / "app.py").write_text(
+            "from diffusers import StableDiffusionPipeline\n"
+            "import transformers\n"
+            'sd = "runwayml/stable-diffusion-v1-5"\n'
+            'asr = "openai/whisper-large-v3"\n'
+        )
+        details = estimate_vram_usage_detailed(tmp_path)
+        assert details is not None
+        models = {m["model"] for m in details["detected_models"]}
+        assert {"Stable Diffusion 1.5", "Whisper Large"} <= models
+        assert details["frameworks"] == ["Diffusers", "Transformers"]
+
+    def test_skips_virtualenv_and_scans_subpackages(self, tmp_path: Path) -> None:
+        """Should scan project subpackages but not installed packages."""
+        (tmp_path / ".venv" / "lib").mkdir(parents=True)
+        (tmp_path / ".venv" / "lib" / "whisper.py").write_text('MODEL = "whisper-large"\n')
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "model.py").write_text('MODEL = "yolov8n.pt"\n')
+        details = estimate_vram_usage_detailed(tmp_path)
+        assert details is not None
+        assert details["detected_models"] == [
+            {"model": "YOLOv8", "vram": 2.0, "file": str(Path("pkg") / "model.py")}
+        ]
+
+    def test_streams_large_files(self, tmp_path: Path) -> None:
+        """Should still find models far into files too large to read whole."""
+        # Shrink the read block so a small file spans many blocks
+        padding = "# generated\n" * 2000
+        (tmp_path / "big.py").write_text(padding + 'MODEL = "bert-base-uncased"\n')
+        with patch("brev_launcher.detect._SCAN_BLOCK_BYTES", 4096):
+            details = estimate_vram_usage_detailed(tmp_path)
+        assert details is not None
+        assert details["base_vram"] == 1.5
+
+    def test_reports_all_models_past_largest_known(self, tmp_path: Path) -> None:
+        """Should keep collecting models and frameworks after the largest model."""
+        (tmp_path / "a.py").write_text('MODEL = "llama-2-70b-chat"\n')
+        (tmp_path / "b.py").write_text('import torch\nMODEL = "bert-large"\n')
+        details = estimate_vram_usage_detailed(tmp_path)
+        assert details is not None
+        assert details["base_vram"] == 140.0
+        assert [m["file"] for m in details["detected_models"]] == ["a.py", "b.py"]
+        assert "PyTorch" in details["frameworks"]
+
+    def test_estimate_stops_after_largest_known_model(self, tmp_path: Path) -> None:
+        """Should stop reading files once the estimate cannot grow."""
+        (tmp_path / "a.py").write_text('MODEL = "llama-2-70b-chat"\n')
+        (tmp_path / "b.py").write_text('MODEL = "bert-large"\n')
+        with patch(
+            "brev_launcher.detect._scan_source_file", wraps=_scan_source_file
+        ) as mock_scan:
+            assert estimate_vram_usage(tmp_path) == 210.0
+        assert mock_scan.call_count == 1
+
+    def test_many_files_report_first_in_walk_order(self, tmp_path: Path) -> None:
+        """Should attribute a model to the first file in walk order."""
+        for i in range(20):
+            (tmp_path / f"mod_{i:02d}.py").write_text('MODEL = "whisper-small"\n')
+        details = estimate_vram_usage_detailed(tmp_path)
+        assert details is not None
+        assert details["detected_models"] == [
+            {"model": "Whisper Small", "vram": 2.0, "file": "mod_00.py"}
+        ]
+
+    def test_skips_binary_files(self, tmp_path: Path) -> None:
+        """Should skip binary files that happen to end in .py."""
+        (tmp_path / "blob.py").write_bytes(b"\x00\x01whisper-large\x00")
+        assert estimate_vram_usage_detailed(tmp_path) is None
+
+    def test_framework_baseline_from_requirements(self, tmp_path: Path) -> None:
+        """Should fall back to a baseline when only a framework is listed."""
+        (tmp_path / "requirements.txt").write_text("torch\n")
+        details = estimate_vram_usage_detailed(tmp_path)
+        assert details is not None
+        assert details["base_vram"] == 4.0
+
+    def test_framework_baseline_from_pyproject(self, tmp_path: Path) -> None:
+        """Should apply the baseline for frameworks listed in pyproject.toml."""
+        (tmp_path / "pyproject.toml").write_text('[project]\ndependencies = ["jax"]\n')
+        details = estimate_vram_usage_detailed(tmp_path)
+        assert details is not None
+        assert details["base_vram"] == 4.0
+
+    @pytest.mark.skipif(sys.version_info < (3, 11), reason="tomllib requires Python 3.11")
+    def test_pyproject_only_dependencies_count(self, tmp_path: Path) -> None:
+        """Should ignore framework names outside pyproject dependency lists."""
+        (tmp_path / "pyproject.toml").write_text(
+            '[project]\ndependencies = ["requests"]\n\n'
+            '[tool.ruff]\nextend-exclude = ["torch_utils"]\n'
+        )
+        assert estimate_vram_usage_detailed(tmp_path) is None
+
+    def test_nothing_detected(self, tmp_path: Path) -> None:
+        """Should return None when no models or frameworks are found."""
+        (tmp_path / "app.py").write_text("print('hello')\n")
+        assert estimate_vram_usage_detailed(tmp_path) is None
+
+
+class TestNvidiaSmiQuery:
+    """Tests for GPU detection via nvidia-smi."""
+
+    def setup_method(self) -> None:
+        _query_nvidia_smi.cache_clear()
+        # Force the nvidia-smi path even if pynvml happens to be installed
+        self._no_nvml = patch.dict(sys.modules, {"pynvml": None})
+        self._no_nvml.start()
+
+    def teardown_method(self) -> None:
+        self._no_nvml.stop()
+        _query_nvidia_smi.cache_clear()
+
+    def test_single_call_for_name_and_memory(self) -> None:
+        """Should read name and memory from one nvidia-smi invocation."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="NVIDIA A10G, 23028\n")
+            assert detect_current_gpu() == "gpu_1x_a10"
+            assert get_gpu_memory_gb() == 22.5
+            assert mock_run.call_count == 1
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("NVIDIA A100-SXM4-40GB", "gpu_1x_a100"),
+            ("NVIDIA A100-SXM4-80GB", "gpu_1x_a100_80gb"),
+            ("NVIDIA H100 80GB HBM3", "gpu_1x_h100"),
+            ("Tesla T4", "gpu_1x_t4"),
+            ("Tesla V100-SXM2-16GB", "gpu_1x_v100"),
+            ("NVIDIA L4", "any"),
+        ],
+    )
+    def test_gpu_name_mapping(self, name: str, expected: str) -> None:
+        """Should map nvidia-smi names to Brev GPU types, most specific first."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=f"{name}, 40960\n")
+            assert detect_current_gpu() == expected
+
+    def test_nvidia_smi_missing(self) -> None:
+        """Should fall back when nvidia-smi is not installed."""
+        with patch("subprocess.run", side_effect=FileNotFoundError):
+            assert detect_current_gpu() == "any"
+            assert get_gpu_memory_gb() is None
+
+    def test_nvml_fast_path(self) -> None:
+        """Should read the GPU through NVML without spawning nvidia-smi."""
+        fake_nvml = MagicMock()
+        fake_nvml.NVMLError = type("NVMLError", (Exception,), {})
+        fake_nvml.nvmlDeviceGetCount.return_value = 1
+        fake_nvml.nvmlDeviceGetName.return_value = b"NVIDIA A100-SXM4-80GB"
+        fake_nvml.nvmlDeviceGetMemoryInfo.return_value.total = 80 * 1024**3
+        with patch.dict(sys.modules, {"pynvml": fake_nvml}), patch("subprocess.run") as mock_run:
+            assert detect_current_gpu() == "gpu_1x_a100_80gb"
+            assert get_gpu_memory_gb() == 80.0
+            mock_run.assert_not_called()
+        fake_nvml.nvmlShutdown.assert_called_once()
+
+    def test_nvml_without_devices_skips_nvidia_smi(self) -> None:
+        """Should trust an initialised NVML that reports no GPUs."""
+        fake_nvml = MagicMock()
+        fake_nvml.NVMLError = type("NVMLError", (Exception,), {})
+        fake_nvml.nvmlDeviceGetCount.return_value = 0
+        with patch.dict(sys.modules, {"pynvml": fake_nvml}), patch("subprocess.run") as mock_run:
+            assert detect_current_gpu() == "any"
+            assert get_gpu_memory_gb() is None
+            mock_run.assert_not_called()
+
+    def test_nvml_shutdown_error_is_ignored(self) -> None:
+        """Should keep the NVML answer when nvmlShutdown raises."""
+        fake_nvml = MagicMock()
+        fake_nvml.NVMLError = type("NVMLError", (Exception,), {})
+        fake_nvml.nvmlDeviceGetCount.return_value = 1
+        fake_nvml.nvmlDeviceGetName.return_value = "Tesla T4"
+        fake_nvml.nvmlDeviceGetMemoryInfo.return_value.total = 16 * 1024**3
+        fake_nvml.nvmlShutdown.side_effect = fake_nvml.NVMLError
+        with patch.dict(sys.modules, {"pynvml": fake_nvml}), patch("subprocess.run") as mock_run:
+            assert detect_current_gpu() == "gpu_1x_t4"
+            assert get_gpu_memory_gb() == 16.0
+            mock_run.assert_not_called()
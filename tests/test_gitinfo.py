@@ -1,8 +1,21 @@
 """Tests for gitinfo module."""
 
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
 
-from brev_launcher.gitinfo import extract_repo_name, normalize_git_url
+from brev_launcher.gitinfo import (
+    clear_git_caches,
+    extract_repo_name,
+    get_default_branch,
+    get_git_info,
+    get_origin_url,
+    is_git_repo,
+    normalize_git_url,
+    probe_git,
+)
 
 
 class TestNormalizeGitUrl:
@@ -78,3 +91,126 @@ class TestExtractRepoName:
         name = extract_repo_name(url)
         assert name == "repo"
 
+
+
+class TestGitProbe:
+    """Tests for probe_git function."""
+
+    def _git(self, path: Path, *args: str) -> None:
+        subprocess.run(["git", *args], cwd=path, capture_output=True, check=True)
+
+    def test_not_a_repo(self, tmp_path: Path) -> None:
+        """Should report no repo and no origin outside a git repository."""
+        assert probe_git(tmp_path) == (False, None)
+
+    def test_repo_without_origin(self, tmp_path: Path) -> None:
+        """Should report a repo with no origin."""
+        self._git(tmp_path, "init")
+        assert probe_git(tmp_path) == (True, None)
+
+    def test_repo_with_origin(self, tmp_path: Path) -> None:
+        """Should return the origin URL."""
+        self._git(tmp_path, "init")
+        self._git(tmp_path, "remote", "add", "origin", "git@github.com:user/repo.git")
+        assert probe_git(tmp_path) == (True, "git@github.com:user/repo.git")
+
+    def test_reads_config_without_spawning_git(self, tmp_path: Path) -> None:
+        """Should read origin from .git/config in a plain repository."""
+        self._git(tmp_path, "init")
+        self._git(tmp_path, "remote", "add", "origin", "https://github.com/user/repo.git")
+        subdir = tmp_path / "src"
+        subdir.mkdir()
+        with patch("subprocess.run") as mock_run:
+            assert probe_git(subdir) == (True, "https://github.com/user/repo.git")
+            mock_run.assert_not_called()
+
+    def test_url_rewrites_fall_back_to_git(self, tmp_path: Path) -> None:
+        """Should let git resolve insteadOf rewrites."""
+        self._git(tmp_path, "init")
+        self._git(tmp_path, "config", "url.https://github.com/.insteadOf", "gh:")
+        self._git(tmp_path, "remote", "add", "origin", "gh:user/repo")
+        assert probe_git(tmp_path) == (True, "https://github.com/user/repo")
+
+    def test_is_git_repo_and_origin_without_spawning_git(self, tmp_path: Path) -> None:
+        """Should answer is_git_repo and get_origin_url from the probe."""
+        self._git(tmp_path, "init")
+        self._git(tmp_path, "remote", "add", "origin", "https://github.com/user/repo")
+        with patch("subprocess.run") as mock_run:
+            assert is_git_repo(tmp_path) is True
+            assert get_origin_url(tmp_path) == "https://github.com/user/repo"
+            mock_run.assert_not_called()
+
+
+class TestGetDefaultBranch:
+    """Tests for get_default_branch function."""
+
+    def _git(self, path: Path, *args: str) -> None:
+        subprocess.run(["git", *args], cwd=path, capture_output=True, check=True)
+
+    def test_remote_head(self, tmp_path: Path) -> None:
+        """Should use origin/HEAD when it is set."""
+        self._git(tmp_path, "init")
+        head = tmp_path / ".git" / "refs" / "remotes" / "origin" / "HEAD"
+        head.parent.mkdir(parents=True)
+        head.write_text("ref: refs/remotes/origin/develop\n")
+        with patch("subprocess.run") as mock_run:
+            assert get_default_branch(tmp_path) == "develop"
+            mock_run.assert_not_called()
+
+    def test_local_master_branch(self, tmp_path: Path) -> None:
+        """Should fall back to an existing local main or master branch."""
+        self._git(tmp_path, "init", "-b", "master")
+        self._git(
+            tmp_path,
+            *("-c", "user.name=t", "-c", "user.email=t@t"),
+            *("commit", "--allow-empty", "-m", "init"),
+        )
+        self._git(tmp_path, "pack-refs", "--all")
+        assert get_default_branch(tmp_path) == "master"
+
+
+class TestGitCaching:
+    """Tests for per-path caching of git queries."""
+
+    def test_repeated_queries_spawn_git_once(self, tmp_path: Path) -> None:
+        """Should answer repeat queries for the same path from the cache."""
+        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True, check=True)
+        subprocess.run(
+            ["git", "remote", "add", "origin", "https://github.com/user/repo.git"],
+            cwd=tmp_path,
+            capture_output=True,
+            check=True,
+        )
+        info = get_git_info(tmp_path)
+
+        with patch("subprocess.run") as mock_run:
+            assert get_git_info(tmp_path / ".") == info
+            assert probe_git(tmp_path) == (True, "https://github.com/user/repo.git")
+            mock_run.assert_not_called()
+
+    def test_picks_up_repository_changes(self, tmp_path: Path) -> None:
+        """Should not serve stale answers after git init or a remote change."""
+        assert probe_git(tmp_path) == (False, None)
+        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True, check=True)
+        assert probe_git(tmp_path) == (True, None)
+
+        subprocess.run(
+            ["git", "remote", "add", "origin", "https://github.com/user/repo.git"],
+            cwd=tmp_path,
+            capture_output=True,
+            check=True,
+        )
+        assert get_origin_url(tmp_path) == "https://github.com/user/repo.git"
+
+    def test_clear_git_caches(self, tmp_path: Path) -> None:
+        """Should query git again after the caches are cleared."""
+        with patch("brev_launcher.gitinfo._find_git_dir", return_value=None), patch(
+            "subprocess.run", return_value=subprocess.CompletedProcess([], 128)
+        ) as mock_run:
+            assert probe_git(tmp_path) == (False, None)
+            assert probe_git(tmp_path) == (False, None)
+            assert mock_run.call_count == 1
+
+            clear_git_caches()
+            assert probe_git(tmp_path) == (False, None)
+            assert mock_run.call_count == 2
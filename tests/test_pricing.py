@@ -0,0 +1,42 @@
+"""Tests for pricing module."""
+
+from brev_launcher.pricing import GPU_PRICING, recommend_gpu
+
+
+class TestRecommendGpu:
+    """Tests for recommend_gpu."""
+
+    def test_recommends_cheapest_fit(self) -> None:
+        """Should recommend the cheapest GPU with 20% headroom."""
+        result = recommend_gpu(14.0)
+
+        assert result["recommended"] == "gpu_1x_a10"
+        assert result["info"] is GPU_PRICING["gpu_1x_a10"]
+
+    def test_options_cheapest_first(self) -> None:
+        """Should list every fitting GPU, cheapest first, without 'any'."""
+        result = recommend_gpu(1.0)
+        ids = [gpu_id for gpu_id, _, _ in result["all_options"]]
+        prices = [info["cost_per_hour"] for _, info, _ in result["all_options"]]
+
+        assert "any" not in ids
+        assert prices == sorted(prices)
+        assert len(ids) == len(GPU_PRICING) - 1
+
+    def test_savings_against_current(self) -> None:
+        """Should compute savings relative to the current GPU."""
+        result = recommend_gpu(1.0, current_gpu="gpu_1x_a10")
+
+        assert result["savings"]["hourly"] == GPU_PRICING["gpu_1x_a10"]["cost_per_hour"] - 0.40
+
+    def test_no_fit(self) -> None:
+        """Should report when no GPU is large enough."""
+        assert recommend_gpu(1000.0)["recommended"] is None
+
+    def test_repeat_calls_return_fresh_results(self) -> None:
+        """Should not let callers mutate the memoized result."""
+        first = recommend_gpu(1.0)
+        first["all_options"].pop()
+        second = recommend_gpu(1.0)
+
+        assert len(second["all_options"]) == len(GPU_PRICING) - 1
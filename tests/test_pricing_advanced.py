@@ -0,0 +1,66 @@
+"""Tests for pricing_advanced module."""
+
+from brev_launcher.pricing_advanced import BREV_INSTANCES, recommend_gpu_advanced
+
+
+class TestRecommendGpuAdvanced:
+    """Tests for recommend_gpu_advanced."""
+
+    def test_recommends_cheapest_fit(self) -> None:
+        """Should recommend the cheapest instance with enough VRAM."""
+        result = recommend_gpu_advanced(20.0)
+        fits = [i for i in BREV_INSTANCES if i.total_vram_gib >= 24.0]
+        cheapest = min(i.price_per_hour for i in fits)
+
+        assert result["recommended"].total_vram_gib >= 24.0
+        assert result["recommended"].price_per_hour == cheapest
+        assert result["total_options"] == len(fits)
+
+    def test_alternatives_sorted_and_unique(self) -> None:
+        """Should list distinct configs in price order after the recommendation."""
+        result = recommend_gpu_advanced(8.0, max_results=10)
+        alternatives = result["alternatives"]
+        prices = [i.price_per_hour for i in alternatives]
+        configs = [(i.gpu_model, i.gpus, i.vram_per_gpu_gib) for i in alternatives]
+
+        assert len(alternatives) == 10
+        assert prices == sorted(prices)
+        assert prices[0] >= result["recommended"].price_per_hour
+        assert len(set(configs)) == len(configs)
+
+    def test_savings(self) -> None:
+        """Should compute savings against the current price."""
+        result = recommend_gpu_advanced(8.0, current_price=10.0)
+        expected = 10.0 - result["recommended"].price_per_hour
+
+        assert result["savings"]["hourly"] == expected
+
+    def test_no_fit(self) -> None:
+        """Should report when nothing is large enough."""
+        result = recommend_gpu_advanced(100000.0)
+
+        assert result["recommended"] is None
+        assert result["alternatives"] == []
+
+    def test_repeat_calls_return_fresh_results(self) -> None:
+        """Should not let callers mutate the memoized result."""
+        first = recommend_gpu_advanced(8.0)
+        first["alternatives"].clear()
+        second = recommend_gpu_advanced(8.0)
+
+        assert second["alternatives"]
+        assert second["recommended"] == first["recommended"]
+
+    def test_alternatives_include_same_config_other_provider(self) -> None:
+        """Should offer the recommended config from the next cheapest provider."""
+        # 40GB with headroom: the cheapest fit is a 1x RTX A6000 sold by two providers
+        result = recommend_gpu_advanced(40.0, max_results=50)
+        rec = result["recommended"]
+        same = [
+            i for i in result["alternatives"]
+            if (i.gpu_model, i.gpus, i.vram_per_gpu_gib) == (rec.gpu_model, rec.gpus, rec.vram_per_gpu_gib)
+        ]
+
+        assert rec.gpu_model == "RTX A6000"
+        assert len(same) == 1
+        assert same[0].provider != rec.provider
@@ -2,53 +2,102 @@
 
 import subprocess
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
+from brev_launcher import project_scan
 from brev_launcher.project_scan import BrevInfo, ProjectScan, check_brev_cli
 
 
+def _fake_run(result):
+    """Plain stand-in for subprocess.run: returns (or raises) result on every call.
+
+    Installed with patch(..., new=...), so calls skip MagicMock's dispatch
+    and bookkeeping. Command lines are recorded in run.calls.
+    """
+    calls = []
+
+    def run(args, **kwargs):
+        calls.append(args)
+        if isinstance(result, BaseException):
+            raise result
+        return subprocess.CompletedProcess(args, 0, stdout=result, stderr="")
+
+    run.calls = calls
+    return run
+
+
 class TestCheckBrevCli:
     """Tests for check_brev_cli."""
 
+    def setup_method(self) -> None:
+        project_scan._BREV_CACHE = None
+
     def test_brev_not_installed(self) -> None:
         """Should return unavailable when brev not in PATH."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=1)
+        fake_run = _fake_run("")
+        with patch("shutil.which", return_value=None), patch("subprocess.run", new=fake_run):
             info = check_brev_cli()
             assert info.available is False
             assert info.instance_name is None
+            assert not any(args[-1] == "ls" for args in fake_run.calls)
 
     def test_brev_installed_no_instances(self) -> None:
         """Should return available with no instance when ls returns nothing."""
-        with patch("subprocess.run") as mock_run:
-            # First call: which brev - success
-            # Second call: brev ls - success but no running instances
-            mock_run.side_effect = [
-                MagicMock(returncode=0, stdout="/usr/local/bin/brev"),
-                MagicMock(returncode=0, stdout="No instances found\n"),
-            ]
+        # brev ls - success but no running instances
+        with patch("shutil.which", return_value="/usr/local/bin/brev"), \
+                patch("subprocess.run", new=_fake_run("No instances found\n")):
             info = check_brev_cli()
             assert info.available is True
 
     def test_brev_installed_with_running_instance(self) -> None:
         """Should detect running instance from brev ls."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = [
-                MagicMock(returncode=0, stdout="/usr/local/bin/brev"),
-                MagicMock(returncode=0, stdout="* my-workspace  RUNNING  gpu-a10\n"),
-            ]
+        with patch("shutil.which", return_value="/usr/local/bin/brev"), \
+                patch("subprocess.run", new=_fake_run("* my-workspace  RUNNING  gpu-a10\n")):
             info = check_brev_cli()
             assert info.available is True
             # Instance detection is best-effort
 
+    def test_parses_instance_row(self) -> None:
+        """Should take the first non-marker token of the active row."""
+        stdout = "NAME  STATUS\nother  STOPPED\n* my-workspace  RUNNING  gpu-a10\n"
+        with patch("shutil.which", return_value="/usr/local/bin/brev"), \
+                patch("subprocess.run", new=_fake_run(stdout)):
+            info = check_brev_cli()
+            assert info.instance_name == "my-workspace"
+            assert info.status == "RUNNING"
+
     def test_timeout_handling(self) -> None:
         """Should handle timeout gracefully."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.TimeoutExpired("brev", 5)
+        with patch("shutil.which", return_value="/usr/local/bin/brev"), \
+                patch("subprocess.run", new=_fake_run(subprocess.TimeoutExpired("brev", 10))):
+            info = check_brev_cli()
+            assert info.available is True
+            assert info.instance_name is None
+
+    def test_gpu_detected_without_brev(self) -> None:
+        """Should still report the local GPU when brev is not installed."""
+        with patch("shutil.which", return_value=None), \
+                patch("brev_launcher.project_scan.detect_current_gpu", return_value="gpu_1x_a10"), \
+                patch("brev_launcher.project_scan.get_gpu_memory_gb", return_value=24.0):
             info = check_brev_cli()
             assert info.available is False
+            assert info.gpu_type == "gpu_1x_a10"
+            assert info.gpu_memory_gb == 24.0
+
+    def test_result_cached(self) -> None:
+        """Should reuse a fresh result and re-query when forced."""
+        with patch("shutil.which", return_value="/usr/local/bin/brev") as mock_which, \
+                patch("subprocess.run", new=_fake_run("No instances found\n")):
+            first = check_brev_cli()
+            second = check_brev_cli()
+            assert mock_which.call_count == 1
+            assert second == first
+            assert second is not first
+
+            check_brev_cli(force=True)
+            assert mock_which.call_count == 2
 
 
 class TestProjectScan:
@@ -90,3 +139,20 @@ class TestProjectScan:
         assert info.available is False
         assert info.instance_name is None
 
+
+    def test_scan_project_defaults_to_current_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should scan the directory current at call time, not import time."""
+        from brev_launcher.project_scan import scan_project
+
+        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True, check=True)
+        subprocess.run(
+            ["git", "remote", "add", "origin", "git@github.com:user/repo.git"],
+            cwd=tmp_path,
+            capture_output=True,
+            check=True,
+        )
+        monkeypatch.chdir(tmp_path)
+        with patch("brev_launcher.project_scan.check_brev_cli", return_value=BrevInfo()):
+            scan = scan_project()
+        assert scan.path == tmp_path
+        assert scan.git.repo_name == "repo"
@@ -1,11 +1,23 @@
 """Tests for render_yaml module."""
 
+import re
 from pathlib import Path
 
 import pytest
 
-from brev_launcher.launchable_schema import LaunchableConfig, SourceConfig
-from brev_launcher.render_yaml import render_yaml, write_launchable_yaml
+from brev_launcher.launchable_schema import ComputeConfig, LaunchableConfig, SourceConfig
+from brev_launcher.render_yaml import (
+    _emit_model,
+    _model_data,
+    as_canonical_bytes,
+    render_many,
+    render_yaml,
+    write_launchable_yaml,
+    write_many,
+)
+
+# The generated_at line under metadata, which differs between runs
+_TIMESTAMP_LINE = re.compile(r"^ *generated_at:.*\n", re.MULTILINE)
 
 
 class TestRenderYaml:
@@ -51,10 +63,7 @@ class TestRenderYaml:
         yaml2 = render_yaml(config)
 
         # Remove timestamp line for comparison
-        lines1 = [l for l in yaml1.split("\n") if "generated_at" not in l]
-        lines2 = [l for l in yaml2.split("\n") if "generated_at" not in l]
-
-        assert lines1 == lines2
+        assert _TIMESTAMP_LINE.sub("", yaml1) == _TIMESTAMP_LINE.sub("", yaml2)
 
     def test_notebook_config(self) -> None:
         """Should include notebook configuration."""
@@ -127,6 +136,45 @@ class TestRenderYaml:
 
         assert name_pos < desc_pos < source_pos < runtime_pos < compute_pos < networking_pos < metadata_pos
 
+    def test_sequence_indentation(self) -> None:
+        """List items should be indented under their key."""
+        config = LaunchableConfig(
+            name="indent-test",
+            description="Indent test",
+            source=SourceConfig(
+                type="git",
+                url="https://github.com/user/indent-test",
+                ref="main",
+                path="/",
+            ),
+        )
+        config.with_webapp(port=7860)
+
+        yaml_str = render_yaml(config)
+
+        assert "networking:\n  ports:\n    - 7860\n" in yaml_str
+        assert "files:\n  include:\n    - .\n" in yaml_str
+
+    def test_ports_keep_order_without_duplicates(self) -> None:
+        """Should list each port once, in the order it was configured."""
+        config = LaunchableConfig(
+            name="ports-test",
+            description="Ports test",
+            source=SourceConfig(
+                type="git",
+                url="https://github.com/user/ports-test",
+                ref="main",
+                path="/",
+            ),
+        )
+        config.with_notebook(port=8888)
+        config.with_webapp(port=7860)
+        config.with_notebook(port=8888)
+
+        yaml_str = render_yaml(config)
+
+        assert "ports:\n    - 8888\n    - 7860\n" in yaml_str
+
     def test_metadata_included(self) -> None:
         """Should include generation metadata."""
         config = LaunchableConfig(
@@ -145,6 +193,159 @@ class TestRenderYaml:
         assert "generated_by: brev-launcher" in yaml_str
         assert "generated_at:" in yaml_str
 
+    def test_concurrent_renders_match(self) -> None:
+        """Should render identically from several threads at once."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        config = LaunchableConfig(
+            name="thread-test",
+            description="Thread test",
+            source=SourceConfig(
+                type="git",
+                url="https://github.com/user/thread-test",
+                ref="main",
+                path="/",
+            ),
+        )
+        config.with_notebook()
+        expected = render_yaml(config)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: render_yaml(config), range(32)))
+
+        assert results == [expected] * 32
+
+    def test_rerender_after_change(self) -> None:
+        """Should reflect config changes made after an earlier render."""
+        config = LaunchableConfig(
+            name="cache-test",
+            description="Cache test",
+            source=SourceConfig(
+                type="git",
+                url="https://github.com/user/cache-test",
+                ref="main",
+                path="/",
+            ),
+        )
+        before = render_yaml(config)
+        config.networking.add_port(7860)
+        after = render_yaml(config)
+
+        assert "- 7860" not in before
+        assert "- 7860" in after
+
+    def test_ruamel_imported_lazily(self) -> None:
+        """Should not import ruamel.yaml until a render needs it."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from brev_launcher.launchable_schema import LaunchableConfig, SourceConfig\n"
+            "from brev_launcher.render_yaml import render_yaml\n"
+            "config = LaunchableConfig(name='p', description='d',\n"
+            "    source=SourceConfig(url='https://github.com/user/p'))\n"
+            "render_yaml(config)\n"
+            "assert 'ruamel.yaml' not in sys.modules\n"
+            "config.description = 'key: value'\n"
+            "render_yaml(config)\n"
+            "assert 'ruamel.yaml' in sys.modules\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+        assert result.returncode == 0, result.stderr
+
+
+class TestAsCanonicalBytes:
+    """Tests for as_canonical_bytes."""
+
+    @staticmethod
+    def _config() -> LaunchableConfig:
+        return LaunchableConfig(
+            name="canonical-test",
+            description="Canonical test",
+            source=SourceConfig(
+                type="git",
+                url="https://github.com/user/canonical-test",
+                ref="main",
+                path="/",
+            ),
+        )
+
+    def test_ignores_timestamp(self) -> None:
+        """Should match for configs that differ only in generated_at."""
+        first = self._config()
+        second = self._config()
+        second.metadata.generated_at = "2000-01-01T00:00:00+00:00"
+
+        assert as_canonical_bytes(first) == as_canonical_bytes(second)
+        assert b"generated_at" not in as_canonical_bytes(first)
+
+    def test_detects_changes(self) -> None:
+        """Should differ when any rendered field changes."""
+        first = self._config()
+        second = self._config()
+        second.networking.add_port(7860)
+
+        assert as_canonical_bytes(first) != as_canonical_bytes(second)
+
+
+class TestDirectEmit:
+    """Tests for the direct YAML writer against ruamel.yaml."""
+
+    @staticmethod
+    def _ruamel(data: dict) -> str:
+        from io import StringIO
+
+        from brev_launcher.render_yaml import _yaml
+
+        stream = StringIO()
+        _yaml().dump(data, stream)
+        return stream.getvalue()
+
+    @pytest.mark.parametrize(
+        "description",
+        [
+            "A test project",
+            "https://github.com/user/repo",
+            "3.10",
+            "yes",
+            ".5",
+            "key: value",
+            "has # comment",
+            "",
+            "trailing colon:",
+            "long " * 20,
+        ],
+    )
+    def test_matches_ruamel(self, description: str) -> None:
+        """Should produce exactly what ruamel.yaml would for any scalar."""
+        config = LaunchableConfig(
+            name="emit-test",
+            description=description,
+            source=SourceConfig(
+                type="git",
+                url="https://github.com/user/emit-test",
+                ref="main",
+                path="/",
+            ),
+        )
+        config.with_notebook()
+        config.with_webapp(port=7860)
+
+        data = _model_data(config)
+
+        assert render_yaml(config) == self._ruamel(data)
+
+    def test_defers_unsure_scalars(self) -> None:
+        """Should leave scalars that need quoting to ruamel.yaml."""
+        lines: list[str] = []
+
+        assert _emit_model(ComputeConfig(note="key: value"), 0, lines) is False
+        lines.clear()
+        assert _emit_model(ComputeConfig(note="plain text"), 0, lines) is True
+        assert lines == ["gpu: any", "note: plain text"]
+
 
 class TestWriteLaunchableYaml:
     """Tests for write_launchable_yaml function."""
@@ -190,3 +391,102 @@ class TestWriteLaunchableYaml:
         assert "old content" not in content
         assert "overwrite-test" in content
 
+    def test_writes_prerendered_content(self, tmp_path: Path) -> None:
+        """Should write pre-rendered YAML byte-identical to the preview."""
+        config = LaunchableConfig(
+            name="prerendered-test",
+            description="Prerendered test",
+            source=SourceConfig(
+                type="git",
+                url="https://github.com/user/prerendered-test",
+                ref="main",
+                path="/",
+            ),
+        )
+        yaml_content = render_yaml(config)
+
+        output_path = write_launchable_yaml(config, tmp_path, yaml_content)
+
+        assert output_path.read_text() == yaml_content
+
+    @pytest.mark.parametrize("description", ["Streamed test", "key: value"])
+    def test_streamed_matches_render(self, tmp_path: Path, description: str) -> None:
+        """Should stream the same YAML that render_yaml returns."""
+        config = LaunchableConfig(
+            name="streamed-test",
+            description=description,
+            source=SourceConfig(
+                type="git",
+                url="https://github.com/user/streamed-test",
+                ref="main",
+                path="/",
+            ),
+        )
+
+        output_path = write_launchable_yaml(config, tmp_path)
+
+        assert output_path.read_text(encoding="utf-8") == render_yaml(config)
+
+    def test_defaults_to_current_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should write to the directory current at call time."""
+        config = LaunchableConfig(
+            name="cwd-test",
+            description="Cwd test",
+            source=SourceConfig(
+                type="git",
+                url="https://github.com/user/cwd-test",
+                ref="main",
+                path="/",
+            ),
+        )
+        monkeypatch.chdir(tmp_path)
+
+        output_path = write_launchable_yaml(config)
+
+        assert output_path == tmp_path / "launchable.yaml"
+        assert output_path.exists()
+
+
+class TestBatchRendering:
+    """Tests for render_many and write_many."""
+
+    @staticmethod
+    def _configs() -> list[LaunchableConfig]:
+        return [
+            LaunchableConfig(
+                name=name,
+                description=description,
+                source=SourceConfig(
+                    type="git",
+                    url=f"https://github.com/user/{name}",
+                    ref="main",
+                    path="/",
+                ),
+            )
+            for name, description in [("batch-a", "First"), ("batch-b", "key: value")]
+        ]
+
+    def test_render_many(self) -> None:
+        """Should render each config like render_yaml, in order."""
+        configs = self._configs()
+
+        assert render_many(configs) == [render_yaml(config) for config in configs]
+
+    def test_write_many(self, tmp_path: Path) -> None:
+        """Should write each config to its own directory."""
+        configs = self._configs()
+        dirs = [tmp_path / "a", tmp_path / "b"]
+        for directory in dirs:
+            directory.mkdir()
+
+        written = write_many(configs, dirs)
+
+        assert written == [directory / "launchable.yaml" for directory in dirs]
+        assert [p.read_text() for p in written] == render_many(configs)
+
+    def test_write_many_length_mismatch(self, tmp_path: Path) -> None:
+        """Should reject mismatched configs and paths."""
+        with pytest.raises(ValueError):
+            write_many(self._configs(), [tmp_path])
+        assert not (tmp_path / "launchable.yaml").exists()
+